@@ -39,7 +39,11 @@ class AccessibilityCheck:
     details: dict[str, Any] = field(default_factory=dict)
 
 
-def check_accessibility(presentation: Presentation) -> ValidationResult:
+def check_accessibility(
+    presentation: Presentation,
+    *,
+    slides: list[dict[str, Any]] | None = None,
+) -> ValidationResult:
     """Check presentation for accessibility issues.
 
     Checks:
@@ -52,6 +56,7 @@ def check_accessibility(presentation: Presentation) -> ValidationResult:
 
     Args:
         presentation: The Presentation to check
+        slides: Output of describe_all_slides() if the caller already has it
 
     Returns:
         ValidationResult with accessibility issues
@@ -66,8 +71,11 @@ def check_accessibility(presentation: Presentation) -> ValidationResult:
     if presentation.slide_count == 0:
         return ValidationResult(is_valid=True, issues=[], score=100.0)
 
-    for i in range(1, presentation.slide_count + 1):
-        slide_issues = _check_slide_accessibility(presentation, i)
+    if slides is None:
+        slides = presentation.describe_all_slides()
+
+    for i, slide_info in enumerate(slides, start=1):
+        slide_issues = _check_slide_accessibility(presentation, i, slide_info)
         issues.extend(slide_issues)
 
     # Calculate score
@@ -83,11 +91,11 @@ def check_accessibility(presentation: Presentation) -> ValidationResult:
 def _check_slide_accessibility(
     presentation: Presentation,
     slide_num: int,
+    slide_info: dict[str, Any],
 ) -> list[ValidationIssue]:
     """Check a single slide for accessibility issues."""
     issues = []
     slide = presentation._pptx.slides[slide_num - 1]
-    slide_info = presentation.describe_slide(slide_num)
 
     # Check for missing title
     if not slide_info.get("has_title"):
@@ -181,7 +189,7 @@ def _check_slide_accessibility(
         )
 
     # Check reading order (shapes should be in logical order)
-    shape_count = len(list(slide.shapes))
+    shape_count = len(slide.shapes)
     if shape_count > 10:
         issues.append(
             ValidationIssue(
@@ -105,6 +105,17 @@ TABLE_PATTERNS = [
     r"^[\w\s]+\s*\|\s*.+$",  # "Key | Value"
 ]
 
+# Compiled once at import; analyze_content runs for every smart slide
+_COMPARISON_RES = [re.compile(p, re.IGNORECASE) for p in COMPARISON_PATTERNS]
+_QUOTE_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in QUOTE_PATTERNS]
+_STATISTIC_RES = [re.compile(p, re.IGNORECASE) for p in STATISTIC_PATTERNS]
+_TIMELINE_RES = [re.compile(p, re.IGNORECASE) for p in TIMELINE_PATTERNS]
+_PROCESS_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in PROCESS_PATTERNS]
+# Any table pattern counts as a hit, so one alternation checks each item once
+_TABLE_RE = re.compile("|".join(f"(?:{p})" for p in TABLE_PATTERNS), re.IGNORECASE)
+_VS_TITLE_RE = re.compile(r"\bvs\.?\b|\bversus\b")
+_VS_SPLIT_RE = re.compile(r"\s+vs\.?\s+|\s+versus\s+", re.IGNORECASE)
+
 
 def analyze_content(
     content: str | list[str] | list[dict] | list[list],
@@ -133,17 +144,12 @@ def analyze_content(
     scores: dict[ContentType, float] = {}
 
     # Comparison detection
-    comparison_matches = sum(
-        1 for p in COMPARISON_PATTERNS if re.search(p, full_text, re.IGNORECASE)
-    )
+    comparison_matches = sum(1 for p in _COMPARISON_RES if p.search(full_text))
     scores[ContentType.COMPARISON] = comparison_matches * 2.5
 
     # Quote detection
-    quote_matches = sum(
-        1
-        for p in QUOTE_PATTERNS
-        if re.search(p, text.strip(), re.IGNORECASE | re.MULTILINE)
-    )
+    stripped = text.strip()
+    quote_matches = sum(1 for p in _QUOTE_RES if p.search(stripped))
     if item_count <= 2 and len(text) > 50:
         scores[ContentType.QUOTE] = quote_matches * 3
     else:
@@ -151,35 +157,27 @@ def analyze_content(
 
     # Statistics detection
     stat_matches = []
-    for p in STATISTIC_PATTERNS:
-        stat_matches.extend(re.findall(p, text, re.IGNORECASE))
+    for p in _STATISTIC_RES:
+        stat_matches.extend(p.findall(text))
     if len(stat_matches) >= 2:
         scores[ContentType.STATISTICS] = len(stat_matches) * 1.5
     else:
         scores[ContentType.STATISTICS] = 0
 
     # Timeline detection
-    timeline_matches = sum(
-        1 for p in TIMELINE_PATTERNS if re.search(p, full_text, re.IGNORECASE)
-    )
+    timeline_matches = sum(1 for p in _TIMELINE_RES if p.search(full_text))
     scores[ContentType.TIMELINE] = timeline_matches * 1.5
 
     # Process/steps detection
-    process_matches = sum(
-        1
-        for p in PROCESS_PATTERNS
-        if re.search(p, full_text, re.IGNORECASE | re.MULTILINE)
-    )
+    process_matches = sum(1 for p in _PROCESS_RES if p.search(full_text))
     scores[ContentType.PROCESS] = process_matches * 2
 
     # Table data detection
     table_matches = 0
     for item in items:
         item_str = item if isinstance(item, str) else str(item)
-        for p in TABLE_PATTERNS:
-            if re.match(p, item_str.strip(), re.IGNORECASE):
-                table_matches += 1
-                break
+        if _TABLE_RE.match(item_str.strip()):
+            table_matches += 1
     if table_matches >= 2:
         scores[ContentType.TABLE_DATA] = table_matches * 2
     else:
@@ -362,9 +360,9 @@ def detect_comparison_parts(
         }
 
     # Check title for vs/versus pattern
-    if re.search(r"\bvs\.?\b|\bversus\b", title_lower):
+    if _VS_TITLE_RE.search(title_lower):
         # Split title to get headings
-        parts = re.split(r"\s+vs\.?\s+|\s+versus\s+", title, flags=re.IGNORECASE)
+        parts = _VS_SPLIT_RE.split(title)
         if len(parts) == 2:
             mid = len(content) // 2
             return {
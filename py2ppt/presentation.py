@@ -7,9 +7,10 @@ AI-friendly, intent-based APIs.
 from __future__ import annotations
 
 import copy
+import io
 from collections.abc import Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 from pptx import Presentation as PptxPresentation
 from pptx.chart.data import CategoryChartData
@@ -77,8 +78,8 @@ class Presentation:
         self._template = template
         self._layouts = template._layouts
 
-        # Create python-pptx presentation from template
-        self._pptx = PptxPresentation(str(template.path))
+        # Create python-pptx presentation from the cached template bytes
+        self._pptx = PptxPresentation(io.BytesIO(template._blob))
 
         # Remove existing slides (keep only layouts/masters)
         while len(self._pptx.slides) > 0:
@@ -155,10 +156,9 @@ class Presentation:
             return layout
 
         # Fuzzy name match
-        layout_lower = layout.lower()
-        for lay in self._layouts:
-            if layout_lower in lay.name.lower() or lay.name.lower() in layout_lower:
-                return lay.index
+        match = self._template.get_layout(layout)
+        if match is not None:
+            return match.index
 
         raise LayoutNotFoundError(
             f"No layout matching '{layout}' found.",
@@ -166,13 +166,42 @@ class Presentation:
             code="LAYOUT_NOT_FOUND",
         )
 
-    def _get_placeholder(self, slide, ph_type):
-        """Get a placeholder by type from a slide."""
+    def _get_placeholder(self, slide, ph_type, *fallback_types):
+        """Get a placeholder by type from a slide.
+
+        Any fallback types are tried in order when ``ph_type`` is absent.
+        The slide's placeholders are scanned once regardless.
+        """
+        fallbacks: dict = {}
         for shape in slide.placeholders:
-            if shape.placeholder_format.type == ph_type:
+            shape_type = shape.placeholder_format.type
+            if shape_type == ph_type:
                 return shape
+            if shape_type in fallback_types:
+                fallbacks.setdefault(shape_type, shape)
+        for fallback_type in fallback_types:
+            if fallback_type in fallbacks:
+                return fallbacks[fallback_type]
         return None
 
+    def _find_shapes(self, slide, *names: str, last: bool = False) -> list:
+        """Find shapes on a slide by name.
+
+        Returns one entry per name (``None`` when missing). The slide's
+        shapes are scanned once, stopping as soon as every name is found.
+        When names are duplicated the first shape wins, or the topmost
+        one if ``last`` is set.
+        """
+        found: dict[str, Any] = {}
+        wanted = set(names)
+        shapes = reversed(list(slide.shapes)) if last else slide.shapes
+        for shape in shapes:
+            if shape.name in wanted and shape.name not in found:
+                found[shape.name] = shape
+                if len(found) == len(wanted):
+                    break
+        return [found.get(name) for name in names]
+
     def _set_text_frame(self, shape, text: str) -> None:
         """Set text in a shape's text frame."""
         if shape is None:
@@ -288,9 +317,9 @@ class Presentation:
         slide = self._pptx.slides.add_slide(slide_layout)
 
         # Set title
-        title_ph = self._get_placeholder(slide, PP_PLACEHOLDER.TITLE)
-        if title_ph is None:
-            title_ph = self._get_placeholder(slide, PP_PLACEHOLDER.CENTER_TITLE)
+        title_ph = self._get_placeholder(
+            slide, PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE
+        )
         self._set_text_frame(title_ph, title)
 
         # Set subtitle
@@ -382,9 +411,9 @@ class Presentation:
         formatted_content, formatted_levels = format_for_py2ppt(paragraphs)
 
         # Set body
-        body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.BODY)
-        if body_ph is None:
-            body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.OBJECT)
+        body_ph = self._get_placeholder(
+            slide, PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
+        )
         self._set_body_content(body_ph, formatted_content, formatted_levels)
 
         slide_num = len(self._pptx.slides)
@@ -644,9 +673,9 @@ class Presentation:
 
             # 3. BODY/OBJECT placeholder bounds
             if not added:
-                body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.BODY)
-                if body_ph is None:
-                    body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.OBJECT)
+                body_ph = self._get_placeholder(
+                    slide, PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
+                )
                 if body_ph is not None:
                     slide.shapes.add_picture(
                         str(image_path),
@@ -1052,35 +1081,24 @@ class Presentation:
 
         layout_name = slide.slide_layout.name
 
-        # Find title
-        title = ""
-        has_title = False
-        for shape in slide.placeholders:
-            if shape.placeholder_format.type in (
-                PP_PLACEHOLDER.TITLE,
-                PP_PLACEHOLDER.CENTER_TITLE,
-            ):
-                title = shape.text
-                has_title = bool(title)
-                break
-
-        # Find body content
+        # Find title and body content in one pass over the placeholders,
+        # reading each paragraph's text (a walk over its runs) only once
+        title = None
         content = []
-        has_content = False
         for shape in slide.placeholders:
-            if (
-                shape.placeholder_format.type
-                in (
-                    PP_PLACEHOLDER.BODY,
-                    PP_PLACEHOLDER.OBJECT,
-                )
+            ph_type = shape.placeholder_format.type
+            if ph_type in (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE):
+                if title is None:
+                    title = shape.text
+            elif (
+                ph_type in (PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT)
                 and shape.has_text_frame
             ):
-                for p in shape.text_frame.paragraphs:
-                    if p.text:
-                        content.append(p.text)
-                if content:
-                    has_content = True
+                paragraph_texts = (p.text for p in shape.text_frame.paragraphs)
+                content.extend(text for text in paragraph_texts if text)
+        title = title or ""
+        has_title = bool(title)
+        has_content = bool(content)
 
         # Inspect all shapes
         has_table = False
@@ -1188,17 +1206,17 @@ class Presentation:
         slide = self._pptx.slides[n - 1]
 
         if title is not None:
-            title_ph = self._get_placeholder(slide, PP_PLACEHOLDER.TITLE)
-            if title_ph is None:
-                title_ph = self._get_placeholder(slide, PP_PLACEHOLDER.CENTER_TITLE)
+            title_ph = self._get_placeholder(
+                slide, PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE
+            )
             self._set_text_frame(title_ph, title)
 
         if content is not None:
             paragraphs = parse_content(content, levels)
             formatted_content, formatted_levels = format_for_py2ppt(paragraphs)
-            body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.BODY)
-            if body_ph is None:
-                body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.OBJECT)
+            body_ph = self._get_placeholder(
+                slide, PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
+            )
             self._set_body_content(body_ph, formatted_content, formatted_levels)
 
         if notes is not None:
@@ -1490,9 +1508,9 @@ class Presentation:
             self._set_text_frame(title_ph, "")
 
         # Set body with formatted quote
-        body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.BODY)
-        if body_ph is None:
-            body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.OBJECT)
+        body_ph = self._get_placeholder(
+            slide, PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
+        )
         self._set_body_content(body_ph, content)
 
         return len(self._pptx.slides)
@@ -1554,9 +1572,9 @@ class Presentation:
             content.append([value_fmt, label_fmt])
 
         # Set body with stats
-        body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.BODY)
-        if body_ph is None:
-            body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.OBJECT)
+        body_ph = self._get_placeholder(
+            slide, PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
+        )
         self._set_body_content(body_ph, content)
 
         return len(self._pptx.slides)
@@ -1619,9 +1637,9 @@ class Presentation:
                 content.append(str(event))
 
         # Set body with timeline
-        body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.BODY)
-        if body_ph is None:
-            body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.OBJECT)
+        body_ph = self._get_placeholder(
+            slide, PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
+        )
         self._set_body_content(body_ph, content)
 
         return len(self._pptx.slides)
@@ -1677,9 +1695,9 @@ class Presentation:
             content.append([num_fmt, item_fmt])
 
         # Set body with agenda
-        body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.BODY)
-        if body_ph is None:
-            body_ph = self._get_placeholder(slide, PP_PLACEHOLDER.OBJECT)
+        body_ph = self._get_placeholder(
+            slide, PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
+        )
         self._set_body_content(body_ph, content)
 
         return len(self._pptx.slides)
@@ -1945,14 +1963,7 @@ class Presentation:
         self._validate_slide_number(slide_num)
         slide = self._pptx.slides[slide_num - 1]
 
-        # Find shapes by name
-        start = None
-        end = None
-        for shape in slide.shapes:
-            if shape.name == start_shape:
-                start = shape
-            if shape.name == end_shape:
-                end = shape
+        start, end = self._find_shapes(slide, start_shape, end_shape, last=True)
 
         if start is None:
             raise InvalidDataError(
@@ -2022,11 +2033,7 @@ class Presentation:
         self._validate_slide_number(slide_num)
         slide = self._pptx.slides[slide_num - 1]
 
-        shape = None
-        for s in slide.shapes:
-            if s.name == shape_name:
-                shape = s
-                break
+        (shape,) = self._find_shapes(slide, shape_name)
 
         if shape is None:
             raise InvalidDataError(
@@ -2709,21 +2716,12 @@ class Presentation:
             )
             circle.line.fill.background()
 
-            # Set transparency via XML
-            try:
-                spPr = circle._sp.spPr
-                ns = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
-                solidFill = spPr.find(".//a:solidFill", ns)
-                if solidFill is not None:
-                    srgbClr = solidFill.find("a:srgbClr", ns)
-                    if srgbClr is not None:
-                        alpha = etree.SubElement(
-                            srgbClr,
-                            "{http://schemas.openxmlformats.org/drawingml/2006/main}alpha",
-                        )
-                        alpha.set("val", "50000")  # 50% opacity
-            except Exception:
-                pass
+            # Set transparency via XML; fill.solid() added an a:solidFill
+            # child to spPr and fore_color.rgb put the a:srgbClr inside it,
+            # so a direct child path reaches it without a tree search
+            srgbClr = circle._sp.spPr.find(f"{qn('a:solidFill')}/{qn('a:srgbClr')}")
+            if srgbClr is not None:
+                etree.SubElement(srgbClr, qn("a:alpha"), val="50000")  # 50% opacity
 
             # Add label
             tf = circle.text_frame
@@ -3206,12 +3204,7 @@ class Presentation:
                 code="IMAGE_NOT_FOUND",
             )
 
-        # Find the placeholder shape
-        placeholder = None
-        for shape in slide.shapes:
-            if shape.name == placeholder_id:
-                placeholder = shape
-                break
+        (placeholder,) = self._find_shapes(slide, placeholder_id)
 
         if placeholder is None:
             raise InvalidDataError(
@@ -3232,11 +3225,12 @@ class Presentation:
         # Add actual image
         slide.shapes.add_picture(str(image_path), left, top, width=width)
 
-    def save(self, path: str | Path) -> None:
+    def save(self, path: str | Path | IO[bytes]) -> None:
         """Save the presentation.
 
         Args:
-            path: Output file path
+            path: Output file path, or a binary file-like object
+                such as ``io.BytesIO``
 
         Example:
             >>> pres.save("output.pptx")
@@ -3353,9 +3347,23 @@ class Presentation:
         Example:
             >>> pres.set_theme_color("accent1", "#FF6600")
         """
+        self.set_theme_colors({color_name: hex_value})
+
+    def set_theme_colors(self, colors: dict[str, str]) -> None:
+        """Modify several theme colors at once.
+
+        The theme part is parsed and re-serialized once for the whole batch,
+        rather than once per color as with repeated set_theme_color() calls.
+
+        Args:
+            colors: Mapping of color name (e.g., "accent1", "dk1") to hex value
+
+        Example:
+            >>> pres.set_theme_colors({"accent1": "#FF6600", "accent2": "#0066FF"})
+        """
         from lxml import etree
 
-        hex_value = hex_value.lstrip("#")
+        ns = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
 
         # Access theme through slide master
         try:
@@ -3364,13 +3372,17 @@ class Presentation:
                 if "theme" in rel.reltype:
                     theme_part = rel.target_part
                     theme_elem = etree.fromstring(theme_part.blob)
-
-                    ns = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
                     clr_scheme = theme_elem.find(".//a:clrScheme", ns)
 
-                    if clr_scheme is not None:
+                    for color_name, hex_value in colors.items():
+                        hex_value = hex_value.lstrip("#")
+
                         # Find the color element
-                        color_elem = clr_scheme.find(f"a:{color_name}", ns)
+                        color_elem = (
+                            clr_scheme.find(f"a:{color_name}", ns)
+                            if clr_scheme is not None
+                            else None
+                        )
                         if color_elem is not None:
                             # Remove existing color definition
                             for child in list(color_elem):
@@ -3383,13 +3395,14 @@ class Presentation:
                             )
                             srgb.set("val", hex_value.upper())
 
-                            # Update the theme part
-                            theme_part._blob = etree.tostring(
-                                theme_elem, xml_declaration=True, encoding="UTF-8"
-                            )
+                        # Update template colors cache
+                        self._template._colors[color_name] = f"#{hex_value}"
 
-                    # Update template colors cache
-                    self._template._colors[color_name] = f"#{hex_value}"
+                    # Update the theme part
+                    if clr_scheme is not None:
+                        theme_part._blob = etree.tostring(
+                            theme_elem, xml_declaration=True, encoding="UTF-8"
+                        )
                     break
         except Exception:
             # Theme modification is best-effort
@@ -6,6 +6,7 @@ AI-readable descriptions of layouts, placeholders, and theme colors.
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -44,8 +45,12 @@ class Template:
         if not self._path.exists():
             raise FileNotFoundError(f"Template not found: {template_path}")
 
+        # Read the package once; every presentation created from this
+        # template is parsed from these bytes instead of reopening the file
+        self._blob = self._path.read_bytes()
+
         # Load the template with python-pptx
-        self._pptx = PptxPresentation(str(self._path))
+        self._pptx = PptxPresentation(io.BytesIO(self._blob))
 
         # Analyze layouts
         self._layouts: list[LayoutDescription] = []
@@ -289,12 +289,15 @@ def validate_slide(
 def validate_presentation(
     presentation: Presentation,
     strict: bool = False,
+    *,
+    slides: list[dict[str, Any]] | None = None,
 ) -> ValidationResult:
     """Validate an entire presentation against design rules.
 
     Args:
         presentation: The Presentation object to validate
         strict: If True, treat warnings as errors
+        slides: Output of describe_all_slides() if the caller already has it
 
     Returns:
         ValidationResult with all issues and quality score
@@ -337,7 +340,7 @@ def validate_presentation(
         )
 
     # Validate each slide and track patterns
-    all_slides = presentation.describe_all_slides()
+    all_slides = slides if slides is not None else presentation.describe_all_slides()
     content_slides_since_break = 0
     layouts_used: set[str] = set()
     has_title_slide = False
@@ -504,20 +507,23 @@ def validate_presentation_extended(
     Returns:
         ValidationResult with all issues
     """
+    # Describe every slide once and share it across all the checks below
+    slides = presentation.describe_all_slides()
+
     # Get base validation result
-    result = validate_presentation(presentation, strict=strict)
+    result = validate_presentation(presentation, strict=strict, slides=slides)
     all_issues = list(result.issues)
 
     # Add accessibility checks if requested
     if include_accessibility:
         from .accessibility import check_accessibility
 
-        access_result = check_accessibility(presentation)
+        access_result = check_accessibility(presentation, slides=slides)
         all_issues.extend(access_result.issues)
 
     # Check brand rules if provided
     if brand_rules:
-        brand_issues = _check_brand_rules(presentation, brand_rules)
+        brand_issues = _check_brand_rules(presentation, brand_rules, slides)
         all_issues.extend(brand_issues)
 
     # Recalculate score
@@ -540,6 +546,7 @@ def validate_presentation_extended(
 def _check_brand_rules(
     presentation: Presentation,
     brand_rules: dict,
+    slides: list[dict[str, Any]],
 ) -> list[ValidationIssue]:
     """Check presentation against brand rules."""
     issues = []
@@ -548,9 +555,8 @@ def _check_brand_rules(
     min_font_size = brand_rules.get("min_font_size")
     max_bullets = brand_rules.get("max_bullets")
 
-    for i in range(1, presentation.slide_count + 1):
+    for i, slide_info in enumerate(slides, start=1):
         slide = presentation._pptx.slides[i - 1]
-        slide_info = presentation.describe_slide(i)
 
         # Check fonts
         if allowed_fonts:
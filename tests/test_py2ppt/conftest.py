@@ -0,0 +1,68 @@
+"""Shared fixtures for py2ppt tests."""
+
+from pathlib import Path
+
+import pytest
+from pptx import Presentation as PptxPresentation
+
+from py2ppt import Presentation, Template
+
+# Minimal valid PNG: a 1x1 red pixel (signature, IHDR, IDAT, IEND)
+TINY_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+    b"\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS"
+    b"\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\xcf\xc0\x00"
+    b"\x00\x03\x01\x01\x00\xc9\xfe\x92\xef\x00\x00\x00\x00IEN"
+    b"D\xaeB`\x82"
+)
+
+
+@pytest.fixture(scope="session")
+def template_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the minimal one-slide template file once per session.
+
+    Each xdist worker gets its own session, so every worker writes the
+    file exactly once and never shares it with another process.
+    """
+    path = tmp_path_factory.mktemp("template") / "template.pptx"
+    pres = PptxPresentation()
+    pres.slides.add_slide(pres.slide_layouts[0])
+    pres.save(str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def tiny_png(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a minimal valid PNG (1x1 red pixel) once per session.
+
+    Tests only read the image, so every test can share the one file.
+    """
+    path = tmp_path_factory.mktemp("images") / "tiny.png"
+    path.write_bytes(TINY_PNG)
+    return path
+
+
+@pytest.fixture(scope="session")
+def template(template_path: Path) -> Template:
+    """Parse the template once per session.
+
+    Presentations are created from the template's cached bytes, so every
+    test still gets an independent deck. Tests that change the template
+    itself (set_theme_color) must build their own.
+    """
+    return Template(template_path)
+
+
+@pytest.fixture
+def presentation(template: Template) -> Presentation:
+    """Create a presentation from template."""
+    return template.create_presentation()
+
+
+@pytest.fixture(scope="session")
+def empty_presentation(template_path: Path) -> Presentation:
+    """One slide-less deck shared by tests that only read from it.
+
+    Tests that add or change anything must use ``presentation`` instead.
+    """
+    return Template(template_path).create_presentation()
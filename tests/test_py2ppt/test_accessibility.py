@@ -1,36 +1,22 @@
 """Tests for accessibility and optimization features."""
 
+import io
 from pathlib import Path
 
 import pytest
 from pptx import Presentation as PptxPresentation
 
-from py2ppt import Template, Presentation
+from py2ppt import Presentation
+from py2ppt.errors import InvalidDataError, SlideNotFoundError
 from py2ppt.validation import IssueCategory
 
 
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
-@pytest.fixture
-def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
-    return template.create_presentation()
-
-
 class TestCheckAccessibility:
     """Tests for check_accessibility method."""
 
-    def test_check_empty_presentation(self, presentation: Presentation) -> None:
+    def test_check_empty_presentation(self, empty_presentation: Presentation) -> None:
         """Test accessibility check on empty presentation."""
-        result = presentation.check_accessibility()
+        result = empty_presentation.check_accessibility()
 
         assert result.is_valid
         assert isinstance(result.score, float)
@@ -102,8 +88,6 @@ class TestOptimizeSlide:
 
     def test_optimize_invalid_slide(self, presentation: Presentation) -> None:
         """Test optimizing invalid slide raises error."""
-        from py2ppt.errors import SlideNotFoundError
-
         presentation.add_title_slide("Title", "")
 
         with pytest.raises(SlideNotFoundError):
@@ -126,9 +110,9 @@ class TestOptimizeAll:
             assert "slide_number" in change
             assert "suggestions" in change
 
-    def test_optimize_all_empty(self, presentation: Presentation) -> None:
+    def test_optimize_all_empty(self, empty_presentation: Presentation) -> None:
         """Test optimizing empty presentation."""
-        all_changes = presentation.optimize_all()
+        all_changes = empty_presentation.optimize_all()
 
         assert len(all_changes) == 0
 
@@ -162,7 +146,7 @@ class TestImagePlaceholders:
         assert any("Second image" in ph["prompt"] for ph in placeholders)
 
     def test_fill_image_placeholder(
-        self, presentation: Presentation, tmp_path: Path
+        self, presentation: Presentation, tiny_png: Path
     ) -> None:
         """Test filling an image placeholder."""
         presentation.add_blank_slide()
@@ -171,14 +155,7 @@ class TestImagePlaceholders:
             1, "Test image", 1, 1, 3, 2
         )
 
-        # Create a test image
-        from PIL import Image
-
-        img_path = tmp_path / "test_image.png"
-        img = Image.new("RGB", (100, 100), color="red")
-        img.save(img_path)
-
-        presentation.fill_image_placeholder(1, ph_id, img_path)
+        presentation.fill_image_placeholder(1, ph_id, tiny_png)
 
         # Placeholder should be gone, image should be there
         placeholders = presentation.get_image_placeholders()
@@ -188,8 +165,6 @@ class TestImagePlaceholders:
         self, presentation: Presentation
     ) -> None:
         """Test filling placeholder with missing image raises error."""
-        from py2ppt.errors import InvalidDataError
-
         presentation.add_blank_slide()
         ph_id = presentation.add_image_placeholder(1, "Test", 1, 1, 2, 2)
 
@@ -197,39 +172,39 @@ class TestImagePlaceholders:
             presentation.fill_image_placeholder(1, ph_id, "nonexistent.png")
 
     def test_fill_placeholder_invalid_id(
-        self, presentation: Presentation, tmp_path: Path
+        self, presentation: Presentation, tiny_png: Path
     ) -> None:
         """Test filling nonexistent placeholder raises error."""
-        from py2ppt.errors import InvalidDataError
-        from PIL import Image
-
         presentation.add_blank_slide()
 
-        img_path = tmp_path / "test.png"
-        img = Image.new("RGB", (50, 50), color="blue")
-        img.save(img_path)
-
         with pytest.raises(InvalidDataError):
-            presentation.fill_image_placeholder(1, "nonexistent_ph", img_path)
+            presentation.fill_image_placeholder(1, "nonexistent_ph", tiny_png)
 
 
 class TestSetAltText:
     """Tests for set_alt_text method."""
 
-    def test_set_alt_text_on_shape(self, presentation: Presentation) -> None:
-        """Test setting alt text on a shape."""
+    @pytest.fixture
+    def rectangle(self, presentation: Presentation) -> tuple[Presentation, str]:
+        """Add a blank slide holding one rectangle."""
         presentation.add_blank_slide()
-        shape_name = presentation.add_shape(1, "rectangle", 1, 1, 2, 2)
+        return presentation, presentation.add_shape(1, "rectangle", 1, 1, 2, 2)
+
+    def test_set_alt_text_on_shape(
+        self, rectangle: tuple[Presentation, str]
+    ) -> None:
+        """Test setting alt text on a shape."""
+        presentation, shape_name = rectangle
 
         presentation.set_alt_text(1, shape_name, "A blue rectangle")
 
         # Should not raise
 
-    def test_set_alt_text_invalid_shape(self, presentation: Presentation) -> None:
+    def test_set_alt_text_invalid_shape(
+        self, rectangle: tuple[Presentation, str]
+    ) -> None:
         """Test setting alt text on nonexistent shape raises error."""
-        from py2ppt.errors import InvalidDataError
-
-        presentation.add_blank_slide()
+        presentation, _ = rectangle
 
         with pytest.raises(InvalidDataError):
             presentation.set_alt_text(1, "NonexistentShape", "Alt text")
@@ -267,22 +242,39 @@ class TestValidateWithAccessibility:
         )
         assert has_bullet_issue
 
+    def test_validate_describes_slides_once(
+        self, presentation: Presentation, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test extended validation shares one description pass."""
+        presentation.add_content_slide("Title", ["Point 1"])
+        presentation.add_blank_slide()
+
+        calls = []
+        describe_all = presentation.describe_all_slides
+
+        def counting_describe_all():
+            calls.append(1)
+            return describe_all()
+
+        monkeypatch.setattr(presentation, "describe_all_slides", counting_describe_all)
+
+        presentation.validate(include_accessibility=True, brand_rules={"max_bullets": 3})
+
+        assert len(calls) == 1
+
 
 class TestSaveWithAccessibility:
     """Tests for saving presentations with accessibility features."""
 
-    def test_save_with_placeholders(
-        self, presentation: Presentation, tmp_path: Path
-    ) -> None:
+    def test_save_with_placeholders(self, presentation: Presentation) -> None:
         """Test saving presentation with image placeholders."""
         presentation.add_blank_slide()
         presentation.add_image_placeholder(1, "Test placeholder", 1, 1, 3, 2)
 
-        output_path = tmp_path / "accessibility_output.pptx"
-        presentation.save(output_path)
-
-        assert output_path.exists()
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
 
         # Verify file can be opened
-        loaded = PptxPresentation(str(output_path))
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) == 1
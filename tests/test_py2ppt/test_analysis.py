@@ -75,6 +75,13 @@ class TestAnalyzeContent:
         result = analyze_content(content)
         assert result.content_type == ContentType.TABLE_DATA
 
+    def test_detects_table_data_mixed_separators(self):
+        """Test that colon, dash and pipe rows all count as table data."""
+        content = ["Region: North America", "Owner - Sales team", "Status | Active"]
+        result = analyze_content(content)
+        assert result.content_type == ContentType.TABLE_DATA
+        assert result.extracted_data["scores"]["table_data"] == 6
+
     def test_single_point_detection(self):
         """Test detection of single point content."""
         content = ["One main idea"]
@@ -1,92 +1,71 @@
 """Tests for chart slide functionality."""
 
-from pathlib import Path
+import io
 
 import pytest
 from pptx import Presentation as PptxPresentation
 
-from py2ppt import Template, Presentation, InvalidDataError
-
-
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
-@pytest.fixture
-def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
-    return template.create_presentation()
+from py2ppt import InvalidDataError, Presentation
 
 
 class TestChartSlide:
     """Tests for add_chart_slide."""
 
-    def test_column_chart(self, presentation: Presentation) -> None:
-        """Test creating a column chart."""
-        slide_num = presentation.add_chart_slide(
-            "Revenue",
-            "column",
-            {
-                "categories": ["Q1", "Q2", "Q3"],
-                "series": [{"name": "2024", "values": [10, 20, 30]}],
-            },
-        )
-        assert slide_num == 1
-        assert presentation.slide_count == 1
-
-    def test_bar_chart(self, presentation: Presentation) -> None:
-        """Test creating a bar chart."""
-        slide_num = presentation.add_chart_slide(
-            "Comparison",
-            "bar",
-            {
-                "categories": ["A", "B", "C"],
-                "series": [{"name": "Data", "values": [5, 10, 15]}],
-            },
-        )
-        assert slide_num == 1
-
-    def test_line_chart(self, presentation: Presentation) -> None:
-        """Test creating a line chart."""
-        slide_num = presentation.add_chart_slide(
-            "Trend",
-            "line",
-            {
-                "categories": ["Jan", "Feb", "Mar"],
-                "series": [{"name": "Users", "values": [100, 150, 200]}],
-            },
-        )
-        assert slide_num == 1
-
-    def test_pie_chart(self, presentation: Presentation) -> None:
-        """Test creating a pie chart."""
-        slide_num = presentation.add_chart_slide(
-            "Distribution",
-            "pie",
-            {
-                "categories": ["Desktop", "Mobile", "Tablet"],
-                "values": [60, 30, 10],
-            },
-        )
-        assert slide_num == 1
+    @pytest.mark.parametrize(
+        "title,chart_type,data",
+        [
+            (
+                "Revenue",
+                "column",
+                {
+                    "categories": ["Q1", "Q2", "Q3"],
+                    "series": [{"name": "2024", "values": [10, 20, 30]}],
+                },
+            ),
+            (
+                "Comparison",
+                "bar",
+                {
+                    "categories": ["A", "B", "C"],
+                    "series": [{"name": "Data", "values": [5, 10, 15]}],
+                },
+            ),
+            (
+                "Trend",
+                "line",
+                {
+                    "categories": ["Jan", "Feb", "Mar"],
+                    "series": [{"name": "Users", "values": [100, 150, 200]}],
+                },
+            ),
+            (
+                "Distribution",
+                "pie",
+                {
+                    "categories": ["Desktop", "Mobile", "Tablet"],
+                    "values": [60, 30, 10],
+                },
+            ),
+            (
+                "Breakdown",
+                "doughnut",
+                {"categories": ["Yes", "No"], "values": [70, 30]},
+            ),
+        ],
+        ids=["column", "bar", "line", "pie", "doughnut"],
+    )
+    def test_chart_type(
+        self,
+        presentation: Presentation,
+        title: str,
+        chart_type: str,
+        data: dict,
+    ) -> None:
+        """Test creating each supported chart type."""
+        slide_num = presentation.add_chart_slide(title, chart_type, data)
 
-    def test_doughnut_chart(self, presentation: Presentation) -> None:
-        """Test creating a doughnut chart."""
-        slide_num = presentation.add_chart_slide(
-            "Breakdown",
-            "doughnut",
-            {
-                "categories": ["Yes", "No"],
-                "values": [70, 30],
-            },
-        )
         assert slide_num == 1
+        assert presentation.slide_count == 1
 
     def test_multi_series_chart(self, presentation: Presentation) -> None:
         """Test multi-series chart gets legend."""
@@ -121,45 +100,46 @@ class TestChartSlide:
             if shape.has_chart:
                 assert shape.chart.has_legend is False
 
-    def test_invalid_chart_type(self, presentation: Presentation) -> None:
-        """Test that invalid chart type raises InvalidDataError."""
-        with pytest.raises(InvalidDataError) as exc_info:
-            presentation.add_chart_slide(
-                "Bad",
+    @pytest.mark.parametrize(
+        "chart_type,data,code",
+        [
+            pytest.param(
                 "radar",
                 {"categories": ["A"], "series": [{"name": "X", "values": [1]}]},
-            )
-        assert "INVALID_CHART_TYPE" in exc_info.value.code
-
-    def test_missing_categories(self, presentation: Presentation) -> None:
-        """Test that missing categories raises InvalidDataError."""
-        with pytest.raises(InvalidDataError) as exc_info:
-            presentation.add_chart_slide(
-                "Bad",
+                "INVALID_CHART_TYPE",
+                id="invalid_chart_type",
+            ),
+            pytest.param(
                 "column",
                 {"series": [{"name": "X", "values": [1]}]},
-            )
-        assert "MISSING_CHART_DATA" in exc_info.value.code
-
-    def test_pie_missing_values(self, presentation: Presentation) -> None:
-        """Test that pie chart without values raises InvalidDataError."""
-        with pytest.raises(InvalidDataError) as exc_info:
-            presentation.add_chart_slide(
-                "Bad Pie",
+                "MISSING_CHART_DATA",
+                id="missing_categories",
+            ),
+            pytest.param(
                 "pie",
                 {"categories": ["A", "B"]},
-            )
-        assert "MISSING_CHART_VALUES" in exc_info.value.code
-
-    def test_bar_missing_series(self, presentation: Presentation) -> None:
-        """Test that bar chart without series raises InvalidDataError."""
-        with pytest.raises(InvalidDataError) as exc_info:
-            presentation.add_chart_slide(
-                "Bad Bar",
+                "MISSING_CHART_VALUES",
+                id="pie_missing_values",
+            ),
+            pytest.param(
                 "bar",
                 {"categories": ["A", "B"]},
-            )
-        assert "MISSING_CHART_SERIES" in exc_info.value.code
+                "MISSING_CHART_SERIES",
+                id="bar_missing_series",
+            ),
+        ],
+    )
+    def test_invalid_chart_data(
+        self,
+        presentation: Presentation,
+        chart_type: str,
+        data: dict,
+        code: str,
+    ) -> None:
+        """Test that bad chart input raises InvalidDataError with its code."""
+        with pytest.raises(InvalidDataError) as exc_info:
+            presentation.add_chart_slide("Bad", chart_type, data)
+        assert code in exc_info.value.code
 
     def test_chart_via_add_slide(self, presentation: Presentation) -> None:
         """Test creating a chart via the add_slide auto-router."""
@@ -171,9 +151,7 @@ class TestChartSlide:
         )
         assert slide_num == 1
 
-    def test_chart_save_and_reload(
-        self, presentation: Presentation, tmp_path: Path
-    ) -> None:
+    def test_chart_save_and_reload(self, presentation: Presentation) -> None:
         """Test that chart slides survive save/reload."""
         presentation.add_chart_slide(
             "Persist",
@@ -183,10 +161,11 @@ class TestChartSlide:
                 "series": [{"name": "S", "values": [1, 2]}],
             },
         )
-        output = tmp_path / "chart_output.pptx"
-        presentation.save(output)
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
 
-        loaded = PptxPresentation(str(output))
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) == 1
         found_chart = False
         for shape in loaded.slides[0].shapes:
@@ -1,27 +1,13 @@
 """Tests for slide cloning and presentation merge features."""
 
+import io
 from pathlib import Path
 
 import pytest
 from pptx import Presentation as PptxPresentation
 
 from py2ppt import Template, Presentation
-
-
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
-@pytest.fixture
-def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
-    return template.create_presentation()
+from py2ppt.errors import SlideNotFoundError
 
 
 class TestCloneSlide:
@@ -77,8 +63,6 @@ class TestCloneSlide:
 
     def test_clone_slide_invalid_source(self, presentation: Presentation) -> None:
         """Test cloning from invalid source raises error."""
-        from py2ppt.errors import SlideNotFoundError
-
         presentation.add_title_slide("Only Slide", "")
 
         with pytest.raises(SlideNotFoundError):
@@ -94,7 +78,7 @@ class TestCloneSlide:
         # Check notes on cloned slide
         slide = presentation._pptx.slides[1]
         notes = slide.notes_slide.notes_text_frame.text
-        assert "speaker notes" in notes.lower()
+        assert notes == "These are speaker notes"
 
 
 class TestCloneSlideFrom:
@@ -149,8 +133,6 @@ class TestCloneSlideFrom:
         self, template: Template
     ) -> None:
         """Test cloning from invalid source slide raises error."""
-        from py2ppt.errors import SlideNotFoundError
-
         pres1 = template.create_presentation()
         pres1.add_title_slide("Only Slide", "")
 
@@ -263,28 +245,24 @@ class TestMergeFiles:
 class TestSaveWithCloning:
     """Tests for saving presentations with cloned slides."""
 
-    def test_save_with_cloned_slides(
-        self, presentation: Presentation, tmp_path: Path
-    ) -> None:
+    def test_save_with_cloned_slides(self, presentation: Presentation) -> None:
         """Test saving presentation with cloned slides."""
         presentation.add_title_slide("Original", "")
         presentation.add_content_slide("Content", ["Point"])
         presentation.clone_slide(1)
         presentation.clone_slide(2)
 
-        output_path = tmp_path / "cloned_output.pptx"
-        presentation.save(output_path)
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
 
-        assert output_path.exists()
         assert presentation.slide_count == 4
 
-        # Verify file can be opened
-        loaded = PptxPresentation(str(output_path))
+        # Verify the saved package can be opened
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) == 4
 
-    def test_save_after_merge(
-        self, template: Template, tmp_path: Path
-    ) -> None:
+    def test_save_after_merge(self, template: Template) -> None:
         """Test saving presentation after merge."""
         pres1 = template.create_presentation()
         pres1.add_title_slide("Main", "")
@@ -294,10 +272,9 @@ class TestSaveWithCloning:
 
         pres1.merge(pres2)
 
-        output_path = tmp_path / "merged_output.pptx"
-        pres1.save(output_path)
-
-        assert output_path.exists()
+        buffer = io.BytesIO()
+        pres1.save(buffer)
+        buffer.seek(0)
 
-        loaded = PptxPresentation(str(output_path))
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) == 2
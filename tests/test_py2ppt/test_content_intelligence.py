@@ -3,25 +3,12 @@
 from pathlib import Path
 
 import pytest
-from pptx import Presentation as PptxPresentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.util import Pt
 
-from py2ppt import Template, Presentation, SlideNotFoundError, LayoutNotFoundError
-
-
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
-@pytest.fixture
-def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
-    return template.create_presentation()
+from py2ppt import Presentation, SlideNotFoundError, LayoutNotFoundError
+from py2ppt.errors import Py2PptError
 
 
 class TestAutoSplit:
@@ -239,48 +226,36 @@ class TestStructuredErrors:
             presentation.describe_slide(1)
         assert "Add slides first" in exc_info.value.suggestion
 
-    def test_layout_not_found_by_name(
-        self, presentation: Presentation
+    @pytest.mark.parametrize("layout", ["NonexistentLayout12345", 999])
+    def test_layout_not_found(
+        self, presentation: Presentation, layout: str | int
     ) -> None:
-        """Test LayoutNotFoundError for bad layout name."""
+        """Test LayoutNotFoundError for a bad layout name or index."""
         with pytest.raises(LayoutNotFoundError) as exc_info:
-            presentation.add_title_slide(
-                "Test", layout="NonexistentLayout12345"
-            )
+            presentation.add_title_slide("Test", layout=layout)
         assert exc_info.value.code == "LAYOUT_NOT_FOUND"
 
-    def test_layout_not_found_by_index(
-        self, presentation: Presentation
-    ) -> None:
-        """Test LayoutNotFoundError for bad layout index."""
-        with pytest.raises(LayoutNotFoundError):
-            presentation.add_title_slide("Test", layout=999)
-
-    def test_set_notes_validates_slide(
-        self, presentation: Presentation
-    ) -> None:
-        """Test that set_notes validates slide number."""
-        with pytest.raises(SlideNotFoundError):
-            presentation.set_notes(1, "Notes")
-
-    def test_delete_validates_slide(
-        self, presentation: Presentation
-    ) -> None:
-        """Test that delete_slide validates slide number."""
-        with pytest.raises(SlideNotFoundError):
-            presentation.delete_slide(1)
-
-    def test_update_validates_slide(
-        self, presentation: Presentation
+    @pytest.mark.parametrize(
+        "method, args, kwargs",
+        [
+            ("set_notes", (1, "Notes"), {}),
+            ("delete_slide", (1,), {}),
+            ("update_slide", (1,), {"title": "Nope"}),
+        ],
+    )
+    def test_mutator_validates_slide(
+        self,
+        empty_presentation: Presentation,
+        method: str,
+        args: tuple,
+        kwargs: dict,
     ) -> None:
-        """Test that update_slide validates slide number."""
+        """Test that slide mutators validate the slide number first."""
         with pytest.raises(SlideNotFoundError):
-            presentation.update_slide(1, title="Nope")
+            getattr(empty_presentation, method)(*args, **kwargs)
 
     def test_error_to_dict(self) -> None:
         """Test Py2PptError.to_dict()."""
-        from py2ppt.errors import Py2PptError
-
         err = Py2PptError("msg", suggestion="fix it", code="TEST")
         d = err.to_dict()
         assert d == {
@@ -294,61 +269,40 @@ class TestStructuredErrors:
 class TestRichTextFormatting:
     """Tests for rich text formatting in presentation slides."""
 
-    def test_bold_text_applied(self, presentation: Presentation) -> None:
-        """Test that bold formatting is applied to runs."""
+    @pytest.mark.parametrize(
+        "fmt, read, expected",
+        [
+            ({"bold": True}, lambda run: run.font.bold, True),
+            ({"italic": True}, lambda run: run.font.italic, True),
+            ({"color": "#FF0000"}, lambda run: run.font.color.rgb, RGBColor(0xFF, 0, 0)),
+            ({"font_size": 24}, lambda run: run.font.size, Pt(24)),
+            (
+                {"hyperlink": "https://example.com"},
+                lambda run: run.hyperlink.address,
+                "https://example.com",
+            ),
+        ],
+        ids=["bold", "italic", "color", "font_size", "hyperlink"],
+    )
+    def test_run_formatting_applied(
+        self, presentation: Presentation, fmt: dict, read, expected
+    ) -> None:
+        """Test that each run-level formatting key is applied."""
         presentation.add_content_slide(
             "Rich Text",
-            [
-                [{"text": "Bold text", "bold": True}],
-            ],
+            [[{"text": "Formatted text", **fmt}]],
         )
         slide = presentation._pptx.slides[0]
-        body = None
-        for shape in slide.placeholders:
-            from pptx.enum.shapes import PP_PLACEHOLDER
-            if shape.placeholder_format.type in (
-                PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
-            ):
-                body = shape
-                break
-
-        if body and body.has_text_frame:
-            para = body.text_frame.paragraphs[0]
-            assert len(para.runs) >= 1
-            assert para.runs[0].font.bold is True
-
-    def test_italic_text_applied(self, presentation: Presentation) -> None:
-        """Test that italic formatting is applied."""
-        presentation.add_content_slide(
-            "Italic",
-            [[{"text": "Italic text", "italic": True}]],
+        body = next(
+            shape
+            for shape in slide.placeholders
+            if shape.placeholder_format.type
+            in (PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT)
         )
-        slide = presentation._pptx.slides[0]
-        for shape in slide.placeholders:
-            from pptx.enum.shapes import PP_PLACEHOLDER
-            if shape.placeholder_format.type in (
-                PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
-            ):
-                para = shape.text_frame.paragraphs[0]
-                if para.runs:
-                    assert para.runs[0].font.italic is True
 
-    def test_color_text_applied(self, presentation: Presentation) -> None:
-        """Test that color formatting is applied."""
-        presentation.add_content_slide(
-            "Color",
-            [[{"text": "Red text", "color": "#FF0000"}]],
-        )
-        slide = presentation._pptx.slides[0]
-        for shape in slide.placeholders:
-            from pptx.enum.shapes import PP_PLACEHOLDER
-            if shape.placeholder_format.type in (
-                PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
-            ):
-                para = shape.text_frame.paragraphs[0]
-                if para.runs:
-                    from pptx.dml.color import RGBColor
-                    assert para.runs[0].font.color.rgb == RGBColor(0xFF, 0, 0)
+        para = body.text_frame.paragraphs[0]
+        assert len(para.runs) >= 1
+        assert read(para.runs[0]) == expected
 
     def test_multi_run_paragraph(self, presentation: Presentation) -> None:
         """Test paragraph with multiple formatted runs."""
@@ -364,7 +318,6 @@ class TestRichTextFormatting:
         )
         slide = presentation._pptx.slides[0]
         for shape in slide.placeholders:
-            from pptx.enum.shapes import PP_PLACEHOLDER
             if shape.placeholder_format.type in (
                 PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
             ):
@@ -383,7 +336,6 @@ class TestRichTextFormatting:
         )
         slide = presentation._pptx.slides[0]
         for shape in slide.placeholders:
-            from pptx.enum.shapes import PP_PLACEHOLDER
             if shape.placeholder_format.type in (
                 PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
             ):
@@ -391,41 +343,6 @@ class TestRichTextFormatting:
                 if para.runs:
                     assert para.runs[0].font.bold is True
 
-    def test_hyperlink_applied(self, presentation: Presentation) -> None:
-        """Test that hyperlinks are applied to runs."""
-        presentation.add_content_slide(
-            "Links",
-            [
-                [{"text": "Click here", "hyperlink": "https://example.com"}],
-            ],
-        )
-        slide = presentation._pptx.slides[0]
-        for shape in slide.placeholders:
-            from pptx.enum.shapes import PP_PLACEHOLDER
-            if shape.placeholder_format.type in (
-                PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
-            ):
-                para = shape.text_frame.paragraphs[0]
-                if para.runs:
-                    assert para.runs[0].hyperlink.address == "https://example.com"
-
-    def test_font_size_applied(self, presentation: Presentation) -> None:
-        """Test that font_size is applied."""
-        from pptx.util import Pt
-        presentation.add_content_slide(
-            "Size",
-            [[{"text": "Big text", "font_size": 24}]],
-        )
-        slide = presentation._pptx.slides[0]
-        for shape in slide.placeholders:
-            from pptx.enum.shapes import PP_PLACEHOLDER
-            if shape.placeholder_format.type in (
-                PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
-            ):
-                para = shape.text_frame.paragraphs[0]
-                if para.runs:
-                    assert para.runs[0].font.size == Pt(24)
-
     def test_plain_string_still_works(
         self, presentation: Presentation
     ) -> None:
@@ -436,7 +353,6 @@ class TestRichTextFormatting:
         )
         slide = presentation._pptx.slides[0]
         for shape in slide.placeholders:
-            from pptx.enum.shapes import PP_PLACEHOLDER
             if shape.placeholder_format.type in (
                 PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT
             ):
@@ -448,40 +364,13 @@ class TestRichTextFormatting:
 class TestImagePositioning:
     """Tests for smart image positioning."""
 
-    @pytest.fixture
-    def tiny_image(self, tmp_path: Path) -> Path:
-        """Create a tiny PNG image for testing."""
-        # Minimal valid PNG (1x1 red pixel)
-        import struct
-        import zlib
-
-        def create_png(path: Path) -> None:
-            signature = b"\x89PNG\r\n\x1a\n"
-            # IHDR
-            ihdr_data = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
-            ihdr_crc = zlib.crc32(b"IHDR" + ihdr_data)
-            ihdr = struct.pack(">I", 13) + b"IHDR" + ihdr_data + struct.pack(">I", ihdr_crc & 0xFFFFFFFF)
-            # IDAT
-            raw = b"\x00\xff\x00\x00"  # filter byte + RGB
-            compressed = zlib.compress(raw)
-            idat_crc = zlib.crc32(b"IDAT" + compressed)
-            idat = struct.pack(">I", len(compressed)) + b"IDAT" + compressed + struct.pack(">I", idat_crc & 0xFFFFFFFF)
-            # IEND
-            iend_crc = zlib.crc32(b"IEND")
-            iend = struct.pack(">I", 0) + b"IEND" + struct.pack(">I", iend_crc & 0xFFFFFFFF)
-            path.write_bytes(signature + ihdr + idat + iend)
-
-        img_path = tmp_path / "test.png"
-        create_png(img_path)
-        return img_path
-
     def test_image_with_explicit_position(
-        self, presentation: Presentation, tiny_image: Path
+        self, presentation: Presentation, tiny_png: Path
     ) -> None:
         """Test adding image with explicit positioning."""
         slide_num = presentation.add_image_slide(
             "Custom Position",
-            tiny_image,
+            tiny_png,
             left=2.0,
             top=3.0,
             width=4.0,
@@ -489,22 +378,22 @@ class TestImagePositioning:
         assert slide_num == 1
 
     def test_image_fallback_positioning(
-        self, presentation: Presentation, tiny_image: Path
+        self, presentation: Presentation, tiny_png: Path
     ) -> None:
         """Test image with default fallback positioning."""
         slide_num = presentation.add_image_slide(
             "Default Position",
-            tiny_image,
+            tiny_png,
         )
         assert slide_num == 1
 
     def test_image_with_caption(
-        self, presentation: Presentation, tiny_image: Path
+        self, presentation: Presentation, tiny_png: Path
     ) -> None:
         """Test image slide with caption."""
         slide_num = presentation.add_image_slide(
             "Captioned",
-            tiny_image,
+            tiny_png,
             caption="A test image",
         )
         assert slide_num == 1
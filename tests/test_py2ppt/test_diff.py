@@ -1,5 +1,6 @@
 """Tests for presentation diff/comparison features."""
 
+import io
 from pathlib import Path
 
 import pytest
@@ -8,19 +9,17 @@ from pptx import Presentation as PptxPresentation
 from py2ppt import Template, Presentation, diff_presentations
 
 
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
 class TestDiffPresentations:
     """Tests for diff_presentations function."""
 
+    @pytest.fixture
+    def titled_pair(self, template: Template) -> tuple[Presentation, Presentation]:
+        """Two decks that start with the same title slide."""
+        pair = (template.create_presentation(), template.create_presentation())
+        for pres in pair:
+            pres.add_title_slide("Title", "")
+        return pair
+
     def test_diff_identical_presentations(self, template: Template) -> None:
         """Test diffing identical presentations."""
         pres1 = template.create_presentation()
@@ -35,13 +34,11 @@ class TestDiffPresentations:
         assert diff["slides_removed"] == []
         assert diff["slides_modified"] == []
 
-    def test_diff_added_slides(self, template: Template) -> None:
+    def test_diff_added_slides(
+        self, titled_pair: tuple[Presentation, Presentation]
+    ) -> None:
         """Test detecting added slides."""
-        pres1 = template.create_presentation()
-        pres1.add_title_slide("Title", "")
-
-        pres2 = template.create_presentation()
-        pres2.add_title_slide("Title", "")
+        pres1, pres2 = titled_pair
         pres2.add_content_slide("New Slide", ["Content"])
 
         diff = diff_presentations(pres1, pres2)
@@ -49,15 +46,13 @@ class TestDiffPresentations:
         assert 2 in diff["slides_added"]
         assert len(diff["slides_removed"]) == 0
 
-    def test_diff_removed_slides(self, template: Template) -> None:
+    def test_diff_removed_slides(
+        self, titled_pair: tuple[Presentation, Presentation]
+    ) -> None:
         """Test detecting removed slides."""
-        pres1 = template.create_presentation()
-        pres1.add_title_slide("Title", "")
+        pres1, pres2 = titled_pair
         pres1.add_content_slide("Removed Slide", ["Content"])
 
-        pres2 = template.create_presentation()
-        pres2.add_title_slide("Title", "")
-
         diff = diff_presentations(pres1, pres2)
 
         assert 2 in diff["slides_removed"]
@@ -90,13 +85,11 @@ class TestDiffPresentations:
         modified = diff["slides_modified"][0]
         assert any("content" in c.lower() for c in modified["changes"])
 
-    def test_diff_text_format(self, template: Template) -> None:
+    def test_diff_text_format(
+        self, titled_pair: tuple[Presentation, Presentation]
+    ) -> None:
         """Test diff with text format output."""
-        pres1 = template.create_presentation()
-        pres1.add_title_slide("Title", "")
-
-        pres2 = template.create_presentation()
-        pres2.add_title_slide("Title", "")
+        pres1, pres2 = titled_pair
         pres2.add_content_slide("New", [])
 
         diff = diff_presentations(pres1, pres2, format="text")
@@ -116,13 +109,11 @@ class TestDiffPresentations:
         assert diff["slides_removed"] == []
         assert diff["slides_modified"] == []
 
-    def test_diff_summary(self, template: Template) -> None:
+    def test_diff_summary(
+        self, titled_pair: tuple[Presentation, Presentation]
+    ) -> None:
         """Test that diff includes a summary."""
-        pres1 = template.create_presentation()
-        pres1.add_title_slide("Title", "")
-
-        pres2 = template.create_presentation()
-        pres2.add_title_slide("Title", "")
+        pres1, pres2 = titled_pair
         pres2.add_content_slide("Added", [])
 
         diff = diff_presentations(pres1, pres2)
@@ -134,22 +125,18 @@ class TestDiffPresentations:
 class TestDescribeMaster:
     """Tests for describe_master method."""
 
-    def test_describe_master_basic(self, template: Template) -> None:
+    def test_describe_master_basic(self, empty_presentation: Presentation) -> None:
         """Test basic master description."""
-        pres = template.create_presentation()
-
-        master = pres.describe_master()
+        master = empty_presentation.describe_master()
 
         assert "name" in master
         assert "layout_count" in master
         assert "colors" in master
         assert "fonts" in master
 
-    def test_describe_master_has_layouts(self, template: Template) -> None:
+    def test_describe_master_has_layouts(self, empty_presentation: Presentation) -> None:
         """Test that master reports layout count."""
-        pres = template.create_presentation()
-
-        master = pres.describe_master()
+        master = empty_presentation.describe_master()
 
         assert master["layout_count"] >= 1
 
@@ -157,20 +144,16 @@ class TestDescribeMaster:
 class TestDescribeLayouts:
     """Tests for describe_layouts method."""
 
-    def test_describe_layouts_basic(self, template: Template) -> None:
+    def test_describe_layouts_basic(self, empty_presentation: Presentation) -> None:
         """Test basic layout description."""
-        pres = template.create_presentation()
-
-        layouts = pres.describe_layouts()
+        layouts = empty_presentation.describe_layouts()
 
         assert isinstance(layouts, list)
         assert len(layouts) >= 1
 
-    def test_describe_layouts_has_info(self, template: Template) -> None:
+    def test_describe_layouts_has_info(self, empty_presentation: Presentation) -> None:
         """Test that layouts include expected info."""
-        pres = template.create_presentation()
-
-        layouts = pres.describe_layouts()
+        layouts = empty_presentation.describe_layouts()
 
         for layout in layouts:
             assert "name" in layout
@@ -180,31 +163,26 @@ class TestDescribeLayouts:
 class TestGetLayout:
     """Tests for get_layout method."""
 
-    def test_get_layout_by_index(self, template: Template) -> None:
+    def test_get_layout_by_index(self, empty_presentation: Presentation) -> None:
         """Test getting layout by index."""
-        pres = template.create_presentation()
-
-        layout = pres.get_layout(0)
+        layout = empty_presentation.get_layout(0)
 
         assert layout is not None
         assert "name" in layout
 
-    def test_get_layout_by_name(self, template: Template) -> None:
+    def test_get_layout_by_name(self, empty_presentation: Presentation) -> None:
         """Test getting layout by name."""
-        pres = template.create_presentation()
-        layouts = pres.describe_layouts()
+        layouts = empty_presentation.describe_layouts()
 
         if layouts:
             first_name = layouts[0]["name"]
-            layout = pres.get_layout(first_name)
+            layout = empty_presentation.get_layout(first_name)
 
             assert layout is not None
 
-    def test_get_layout_not_found(self, template: Template) -> None:
+    def test_get_layout_not_found(self, empty_presentation: Presentation) -> None:
         """Test getting nonexistent layout returns None."""
-        pres = template.create_presentation()
-
-        layout = pres.get_layout("Nonexistent Layout Name")
+        layout = empty_presentation.get_layout("Nonexistent Layout Name")
 
         assert layout is None
 
@@ -212,22 +190,70 @@ class TestGetLayout:
 class TestThemeModification:
     """Tests for theme modification features."""
 
-    def test_set_theme_color(self, template: Template) -> None:
+    @pytest.fixture
+    def template(self, template_path: Path) -> Template:
+        """A private template, since set_theme_color updates its colors.
+
+        Overriding ``template`` here also makes the shared ``presentation``
+        fixture build from this private copy.
+        """
+        return Template(template_path)
+
+    def test_set_theme_color(
+        self, template: Template, presentation: Presentation
+    ) -> None:
         """Test setting a theme color."""
-        pres = template.create_presentation()
+        presentation.set_theme_color("accent1", "#FF6600")
+
+        assert template.colors["accent1"] == "#FF6600"
+        assert presentation.describe_master()["colors"]["accent1"] == "#FF6600"
+
+    def test_set_theme_color_survives_save(self, presentation: Presentation) -> None:
+        """Test a modified theme color is written into the saved theme."""
+        presentation.set_theme_color("accent1", "#FF6600")
+
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
+
+        loaded = PptxPresentation(buffer)
+        theme_blobs = [
+            rel.target_part.blob
+            for rel in loaded.slide_master.part.rels.values()
+            if "theme" in rel.reltype
+        ]
+        assert any(b"FF6600" in blob for blob in theme_blobs)
+
+    def test_set_theme_colors_batch(
+        self, template: Template, presentation: Presentation
+    ) -> None:
+        """Test setting several theme colors in one call."""
+        presentation.set_theme_colors({"accent1": "#FF6600", "accent2": "#0066FF"})
+
+        assert template.colors["accent1"] == "#FF6600"
+        assert template.colors["accent2"] == "#0066FF"
+
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
 
-        # Should not raise
-        pres.set_theme_color("accent1", "#FF6600")
+        loaded = PptxPresentation(buffer)
+        theme_blob = next(
+            rel.target_part.blob
+            for rel in loaded.slide_master.part.rels.values()
+            if "theme" in rel.reltype
+        )
+        assert b"FF6600" in theme_blob
+        assert b"0066FF" in theme_blob
 
     def test_save_as_template(
-        self, template: Template, tmp_path: Path
+        self, presentation: Presentation, tmp_path: Path
     ) -> None:
         """Test saving as a template."""
-        pres = template.create_presentation()
-        pres.add_title_slide("Template Test", "")
+        presentation.add_title_slide("Template Test", "")
 
         output_path = tmp_path / "new_template.pptx"
-        pres.save_as_template(output_path)
+        presentation.save_as_template(output_path)
 
         assert output_path.exists()
 
@@ -1,29 +1,13 @@
 """Tests for Markdown import/export features."""
 
+import io
 from pathlib import Path
 
-import pytest
 from pptx import Presentation as PptxPresentation
 
 from py2ppt import Template, Presentation, build_from_markdown
 
 
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
-@pytest.fixture
-def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
-    return template.create_presentation()
-
-
 class TestToMarkdown:
     """Tests for to_markdown export method."""
 
@@ -72,9 +56,9 @@ class TestToMarkdown:
 
         assert "Section:" in md
 
-    def test_export_empty_presentation(self, presentation: Presentation) -> None:
+    def test_export_empty_presentation(self, empty_presentation: Presentation) -> None:
         """Test exporting an empty presentation."""
-        md = presentation.to_markdown()
+        md = empty_presentation.to_markdown()
 
         # Should return empty or minimal markdown
         assert isinstance(md, str)
@@ -164,7 +148,7 @@ class TestBuildFromMarkdown:
         assert pres.slide_count == 1
         slide = pres._pptx.slides[0]
         notes = slide.notes_slide.notes_text_frame.text
-        assert "emphasize" in notes.lower()
+        assert notes == "Remember to emphasize this point"
 
     def test_build_from_file(self, template: Template, tmp_path: Path) -> None:
         """Test building from a Markdown file."""
@@ -260,9 +244,7 @@ class TestMarkdownRoundTrip:
 class TestSaveWithMarkdown:
     """Tests for saving presentations built from Markdown."""
 
-    def test_save_markdown_built(
-        self, template: Template, tmp_path: Path
-    ) -> None:
+    def test_save_markdown_built(self, template: Template) -> None:
         """Test saving a presentation built from Markdown."""
         md = """
 # Markdown Presentation
@@ -278,11 +260,10 @@ class TestSaveWithMarkdown:
 """
         pres = build_from_markdown(template, md)
 
-        output_path = tmp_path / "from_markdown.pptx"
-        pres.save(output_path)
-
-        assert output_path.exists()
+        buffer = io.BytesIO()
+        pres.save(buffer)
+        buffer.seek(0)
 
         # Verify saved file
-        loaded = PptxPresentation(str(output_path))
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) >= 2
@@ -1,69 +1,61 @@
 """Tests for strategic slide pattern features."""
 
-from pathlib import Path
+import io
 
 import pytest
 from pptx import Presentation as PptxPresentation
+from pptx.oxml.ns import qn
 
-from py2ppt import Template, Presentation
-
-
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
-@pytest.fixture
-def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
-    return template.create_presentation()
+from py2ppt import Presentation
 
 
 class TestSwotSlide:
     """Tests for add_swot_slide method."""
 
-    def test_add_basic_swot(self, presentation: Presentation) -> None:
-        """Test adding a basic SWOT slide."""
-        slide_num = presentation.add_swot_slide(
-            "SWOT Analysis",
-            strengths=["Strong brand", "Skilled team"],
-            weaknesses=["Limited budget"],
-            opportunities=["New markets"],
-            threats=["Competition"]
-        )
+    @pytest.mark.parametrize(
+        "title,quadrants",
+        [
+            pytest.param(
+                "SWOT Analysis",
+                {
+                    "strengths": ["Strong brand", "Skilled team"],
+                    "weaknesses": ["Limited budget"],
+                    "opportunities": ["New markets"],
+                    "threats": ["Competition"],
+                },
+                id="basic",
+            ),
+            pytest.param(
+                "SWOT Analysis",
+                {
+                    "strengths": ["One strength"],
+                    "weaknesses": [],
+                    "opportunities": ["Opportunity 1", "Opportunity 2"],
+                    "threats": [],
+                },
+                id="empty_quadrants",
+            ),
+            pytest.param(
+                "Detailed SWOT",
+                {
+                    "strengths": ["S1", "S2", "S3", "S4", "S5"],
+                    "weaknesses": ["W1", "W2", "W3"],
+                    "opportunities": ["O1", "O2", "O3", "O4"],
+                    "threats": ["T1", "T2"],
+                },
+                id="many_items",
+            ),
+        ],
+    )
+    def test_add_swot(
+        self, presentation: Presentation, title: str, quadrants: dict
+    ) -> None:
+        """Test adding a SWOT slide with varied quadrant contents."""
+        slide_num = presentation.add_swot_slide(title, **quadrants)
 
         assert slide_num == 1
         assert presentation.slide_count == 1
 
-    def test_swot_with_empty_quadrants(self, presentation: Presentation) -> None:
-        """Test SWOT with some empty quadrants."""
-        slide_num = presentation.add_swot_slide(
-            "SWOT Analysis",
-            strengths=["One strength"],
-            weaknesses=[],
-            opportunities=["Opportunity 1", "Opportunity 2"],
-            threats=[]
-        )
-
-        assert slide_num == 1
-
-    def test_swot_with_many_items(self, presentation: Presentation) -> None:
-        """Test SWOT with many items in each quadrant."""
-        slide_num = presentation.add_swot_slide(
-            "Detailed SWOT",
-            strengths=["S1", "S2", "S3", "S4", "S5"],
-            weaknesses=["W1", "W2", "W3"],
-            opportunities=["O1", "O2", "O3", "O4"],
-            threats=["T1", "T2"]
-        )
-
-        assert slide_num == 1
-
 
 class TestMatrixSlide:
     """Tests for add_matrix_slide method."""
@@ -112,172 +104,160 @@ class TestMatrixSlide:
 class TestFunnelSlide:
     """Tests for add_funnel_slide method."""
 
-    def test_add_basic_funnel(self, presentation: Presentation) -> None:
-        """Test adding a basic funnel slide."""
-        slide_num = presentation.add_funnel_slide(
-            "Sales Funnel",
-            stages=[
-                {"label": "Leads", "value": "1000"},
-                {"label": "Qualified", "value": "400"},
-                {"label": "Proposals", "value": "100"},
-                {"label": "Closed", "value": "25"}
-            ]
-        )
+    @pytest.mark.parametrize(
+        "title,stages",
+        [
+            pytest.param(
+                "Sales Funnel",
+                [
+                    {"label": "Leads", "value": "1000"},
+                    {"label": "Qualified", "value": "400"},
+                    {"label": "Proposals", "value": "100"},
+                    {"label": "Closed", "value": "25"},
+                ],
+                id="dict_stages",
+            ),
+            pytest.param(
+                "Process Funnel",
+                ["Awareness", "Interest", "Consideration", "Purchase"],
+                id="string_stages",
+            ),
+            pytest.param(
+                "Conversion Funnel",
+                [
+                    {"label": "Visitors", "value": "10K"},
+                    "Signups",
+                    {"label": "Active Users", "value": "500"},
+                ],
+                id="mixed_stages",
+            ),
+        ],
+    )
+    def test_add_funnel(
+        self, presentation: Presentation, title: str, stages: list
+    ) -> None:
+        """Test adding a funnel slide from each stage format."""
+        slide_num = presentation.add_funnel_slide(title, stages=stages)
 
         assert slide_num == 1
         assert presentation.slide_count == 1
 
-    def test_funnel_with_string_stages(self, presentation: Presentation) -> None:
-        """Test funnel with simple string stages."""
-        slide_num = presentation.add_funnel_slide(
-            "Process Funnel",
-            stages=["Awareness", "Interest", "Consideration", "Purchase"]
-        )
-
-        assert slide_num == 1
-
-    def test_funnel_with_mixed_stages(self, presentation: Presentation) -> None:
-        """Test funnel with mixed dict and string stages."""
-        slide_num = presentation.add_funnel_slide(
-            "Conversion Funnel",
-            stages=[
-                {"label": "Visitors", "value": "10K"},
-                "Signups",
-                {"label": "Active Users", "value": "500"}
-            ]
-        )
-
-        assert slide_num == 1
-
 
 class TestPyramidSlide:
     """Tests for add_pyramid_slide method."""
 
-    def test_add_basic_pyramid(self, presentation: Presentation) -> None:
-        """Test adding a basic pyramid slide."""
-        slide_num = presentation.add_pyramid_slide(
-            "Strategic Hierarchy",
-            levels=["Vision", "Strategy", "Tactics", "Operations"]
-        )
+    @pytest.mark.parametrize(
+        "title,levels",
+        [
+            pytest.param(
+                "Strategic Hierarchy",
+                ["Vision", "Strategy", "Tactics", "Operations"],
+                id="basic",
+            ),
+            pytest.param("Simple Pyramid", ["Top", "Bottom"], id="few_levels"),
+            pytest.param(
+                "Maslow's Hierarchy",
+                [
+                    "Self-Actualization",
+                    "Esteem",
+                    "Love/Belonging",
+                    "Safety",
+                    "Physiological",
+                ],
+                id="many_levels",
+            ),
+        ],
+    )
+    def test_add_pyramid(
+        self, presentation: Presentation, title: str, levels: list[str]
+    ) -> None:
+        """Test adding a pyramid slide with varying level counts."""
+        slide_num = presentation.add_pyramid_slide(title, levels=levels)
 
         assert slide_num == 1
         assert presentation.slide_count == 1
 
-    def test_pyramid_with_few_levels(self, presentation: Presentation) -> None:
-        """Test pyramid with only 2 levels."""
-        slide_num = presentation.add_pyramid_slide(
-            "Simple Pyramid",
-            levels=["Top", "Bottom"]
-        )
-
-        assert slide_num == 1
-
-    def test_pyramid_with_many_levels(self, presentation: Presentation) -> None:
-        """Test pyramid with many levels."""
-        slide_num = presentation.add_pyramid_slide(
-            "Maslow's Hierarchy",
-            levels=[
-                "Self-Actualization",
-                "Esteem",
-                "Love/Belonging",
-                "Safety",
-                "Physiological"
-            ]
-        )
-
-        assert slide_num == 1
-
 
 class TestProcessSlide:
     """Tests for add_process_slide method."""
 
-    def test_add_basic_process(self, presentation: Presentation) -> None:
-        """Test adding a basic process slide."""
-        slide_num = presentation.add_process_slide(
-            "Development Process",
-            steps=["Plan", "Build", "Test", "Deploy"]
-        )
+    @pytest.mark.parametrize(
+        "title,steps",
+        [
+            pytest.param(
+                "Development Process",
+                ["Plan", "Build", "Test", "Deploy"],
+                id="basic",
+            ),
+            pytest.param("Simple Process", ["Start", "Finish"], id="few_steps"),
+            pytest.param(
+                "Extended Process",
+                ["Initiate", "Plan", "Execute", "Monitor", "Control", "Close"],
+                id="many_steps",
+            ),
+            pytest.param("Empty Process", [], id="empty_steps"),
+        ],
+    )
+    def test_add_process(
+        self, presentation: Presentation, title: str, steps: list[str]
+    ) -> None:
+        """Test adding a process slide with varying step counts."""
+        slide_num = presentation.add_process_slide(title, steps=steps)
 
         assert slide_num == 1
         assert presentation.slide_count == 1
 
-    def test_process_with_few_steps(self, presentation: Presentation) -> None:
-        """Test process with only 2 steps."""
-        slide_num = presentation.add_process_slide(
-            "Simple Process",
-            steps=["Start", "Finish"]
-        )
-
-        assert slide_num == 1
-
-    def test_process_with_many_steps(self, presentation: Presentation) -> None:
-        """Test process with many steps."""
-        slide_num = presentation.add_process_slide(
-            "Extended Process",
-            steps=["Initiate", "Plan", "Execute", "Monitor", "Control", "Close"]
-        )
-
-        assert slide_num == 1
-
-    def test_process_empty_steps(self, presentation: Presentation) -> None:
-        """Test process with empty steps."""
-        slide_num = presentation.add_process_slide(
-            "Empty Process",
-            steps=[]
-        )
-
-        assert slide_num == 1
-
 
 class TestVennSlide:
     """Tests for add_venn_slide method."""
 
-    def test_add_two_circle_venn(self, presentation: Presentation) -> None:
-        """Test adding a 2-circle Venn diagram."""
-        slide_num = presentation.add_venn_slide(
-            "Skills Overlap",
-            sets=["Technical", "Creative"],
-            intersection_label="Innovation"
-        )
+    @pytest.mark.parametrize(
+        "title,sets,kwargs",
+        [
+            pytest.param(
+                "Skills Overlap",
+                ["Technical", "Creative"],
+                {"intersection_label": "Innovation"},
+                id="two_circles",
+            ),
+            pytest.param(
+                "Role Requirements",
+                ["Technical", "Business", "Leadership"],
+                {"intersection_label": "Ideal Candidate"},
+                id="three_circles",
+            ),
+            pytest.param(
+                "Concepts", ["Set A", "Set B"], {}, id="no_intersection_label"
+            ),
+            pytest.param("Single Set", ["Only One"], {}, id="single_set"),
+        ],
+    )
+    def test_add_venn(
+        self,
+        presentation: Presentation,
+        title: str,
+        sets: list[str],
+        kwargs: dict,
+    ) -> None:
+        """Test adding a Venn diagram with varying set counts."""
+        slide_num = presentation.add_venn_slide(title, sets=sets, **kwargs)
 
         assert slide_num == 1
         assert presentation.slide_count == 1
 
-    def test_add_three_circle_venn(self, presentation: Presentation) -> None:
-        """Test adding a 3-circle Venn diagram."""
-        slide_num = presentation.add_venn_slide(
-            "Role Requirements",
-            sets=["Technical", "Business", "Leadership"],
-            intersection_label="Ideal Candidate"
-        )
+    def test_venn_circles_are_translucent(self, presentation: Presentation) -> None:
+        """Test that each Venn circle fill gets an alpha element."""
+        presentation.add_venn_slide("Overlap", sets=["A", "B", "C"])
 
-        assert slide_num == 1
-
-    def test_venn_without_intersection_label(self, presentation: Presentation) -> None:
-        """Test Venn without intersection label."""
-        slide_num = presentation.add_venn_slide(
-            "Concepts",
-            sets=["Set A", "Set B"]
-        )
-
-        assert slide_num == 1
-
-    def test_venn_with_single_set(self, presentation: Presentation) -> None:
-        """Test Venn with single set (should still work)."""
-        slide_num = presentation.add_venn_slide(
-            "Single Set",
-            sets=["Only One"]
-        )
-
-        assert slide_num == 1
+        slide = presentation._pptx.slides[0]
+        alphas = list(slide._element.iter(qn("a:alpha")))
+        assert [a.get("val") for a in alphas] == ["50000"] * 3
 
 
 class TestSaveWithPatterns:
     """Tests for saving presentations with pattern slides."""
 
-    def test_save_with_all_patterns(
-        self, presentation: Presentation, tmp_path: Path
-    ) -> None:
+    def test_save_with_all_patterns(self, presentation: Presentation) -> None:
         """Test saving presentation with all pattern types."""
         presentation.add_swot_slide(
             "SWOT",
@@ -304,12 +284,12 @@ class TestSaveWithPatterns:
             ["A", "B", "C"]
         )
 
-        output_path = tmp_path / "patterns_output.pptx"
-        presentation.save(output_path)
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
 
-        assert output_path.exists()
         assert presentation.slide_count == 6
 
-        # Verify saved file can be opened
-        loaded = PptxPresentation(str(output_path))
+        # Verify the saved package can be opened
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) == 6
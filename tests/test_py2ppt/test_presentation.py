@@ -1,5 +1,6 @@
 """Tests for Presentation class."""
 
+import io
 from pathlib import Path
 
 import pytest
@@ -8,22 +9,6 @@ from pptx import Presentation as PptxPresentation
 from py2ppt import Template, Presentation
 
 
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
-@pytest.fixture
-def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
-    return template.create_presentation()
-
-
 class TestPresentation:
     """Tests for the Presentation class."""
 
@@ -33,66 +18,56 @@ class TestPresentation:
         assert isinstance(pres, Presentation)
         assert pres.slide_count == 0
 
-    def test_add_title_slide(self, presentation: Presentation) -> None:
-        """Test adding a title slide."""
-        slide_num = presentation.add_title_slide("Test Title", "Subtitle")
-
-        assert slide_num == 1
-        assert presentation.slide_count == 1
-
-    def test_add_content_slide(self, presentation: Presentation) -> None:
-        """Test adding a content slide."""
-        slide_num = presentation.add_content_slide(
-            "Content Slide",
-            ["Point 1", "Point 2", "Point 3"]
-        )
-
-        assert slide_num == 1
-        assert presentation.slide_count == 1
-
-    def test_add_content_slide_with_levels(self, presentation: Presentation) -> None:
-        """Test adding a content slide with nested bullets."""
-        slide_num = presentation.add_content_slide(
-            "Nested Content",
-            ["Main point", "Sub point 1", "Sub point 2", "Another main"],
-            levels=[0, 1, 1, 0]
-        )
-
-        assert slide_num == 1
-        assert presentation.slide_count == 1
-
-    def test_add_section_slide(self, presentation: Presentation) -> None:
-        """Test adding a section slide."""
-        slide_num = presentation.add_section_slide("Section Title")
-
-        assert slide_num == 1
-        assert presentation.slide_count == 1
-
-    def test_add_two_column_slide(self, presentation: Presentation) -> None:
-        """Test adding a two-column slide."""
-        slide_num = presentation.add_two_column_slide(
-            "Two Columns",
-            ["Left 1", "Left 2"],
-            ["Right 1", "Right 2"]
-        )
-
-        assert slide_num == 1
-        assert presentation.slide_count == 1
-
-    def test_add_comparison_slide(self, presentation: Presentation) -> None:
-        """Test adding a comparison slide."""
-        slide_num = presentation.add_comparison_slide(
-            "Comparison",
-            "Before", ["Old way 1", "Old way 2"],
-            "After", ["New way 1", "New way 2"]
-        )
-
-        assert slide_num == 1
-        assert presentation.slide_count == 1
-
-    def test_add_blank_slide(self, presentation: Presentation) -> None:
-        """Test adding a blank slide."""
-        slide_num = presentation.add_blank_slide()
+    @pytest.mark.parametrize(
+        "method,args,kwargs",
+        [
+            pytest.param(
+                "add_title_slide", ("Test Title", "Subtitle"), {}, id="title"
+            ),
+            pytest.param(
+                "add_content_slide",
+                ("Content Slide", ["Point 1", "Point 2", "Point 3"]),
+                {},
+                id="content",
+            ),
+            pytest.param(
+                "add_content_slide",
+                (
+                    "Nested Content",
+                    ["Main point", "Sub point 1", "Sub point 2", "Another main"],
+                ),
+                {"levels": [0, 1, 1, 0]},
+                id="content_with_levels",
+            ),
+            pytest.param("add_section_slide", ("Section Title",), {}, id="section"),
+            pytest.param(
+                "add_two_column_slide",
+                ("Two Columns", ["Left 1", "Left 2"], ["Right 1", "Right 2"]),
+                {},
+                id="two_column",
+            ),
+            pytest.param(
+                "add_comparison_slide",
+                (
+                    "Comparison",
+                    "Before", ["Old way 1", "Old way 2"],
+                    "After", ["New way 1", "New way 2"],
+                ),
+                {},
+                id="comparison",
+            ),
+            pytest.param("add_blank_slide", (), {}, id="blank"),
+        ],
+    )
+    def test_add_slide_type(
+        self,
+        presentation: Presentation,
+        method: str,
+        args: tuple,
+        kwargs: dict,
+    ) -> None:
+        """Test that each slide builder adds exactly one slide."""
+        slide_num = getattr(presentation, method)(*args, **kwargs)
 
         assert slide_num == 1
         assert presentation.slide_count == 1
@@ -118,25 +93,25 @@ class TestPresentation:
     def test_set_notes(self, presentation: Presentation) -> None:
         """Test setting speaker notes."""
         presentation.add_title_slide("Title")
-        presentation.set_notes(1, "These are speaker notes.")
+        presentation.set_notes(1, "These are speaker notes.\nSecond line.")
 
-        # Verify notes were set
+        # Verify notes were set, one paragraph per line
         slide = presentation._pptx.slides[0]
         notes = slide.notes_slide.notes_text_frame.text
-        assert "speaker notes" in notes.lower()
+        assert notes == "These are speaker notes.\nSecond line."
 
-    def test_save(self, presentation: Presentation, tmp_path: Path) -> None:
+    def test_save(self, presentation: Presentation) -> None:
         """Test saving a presentation."""
         presentation.add_title_slide("Test")
 
-        output_path = tmp_path / "output.pptx"
-        presentation.save(output_path)
-
-        assert output_path.exists()
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
 
-        # Verify saved file can be opened
-        loaded = PptxPresentation(str(output_path))
+        # Verify saved package can be opened
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) == 1
+        assert loaded.slides[0].shapes.title.text == "Test"
 
     def test_repr(self, presentation: Presentation) -> None:
         """Test string representation."""
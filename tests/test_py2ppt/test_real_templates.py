@@ -16,9 +16,13 @@ from py2ppt import Template
 class TestAWSTemplate:
     """Tests using the AWS corporate template."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def aws_template(self) -> Template | None:
-        """Get the AWS template if it exists."""
+        """Load the AWS template once for the class, if it exists.
+
+        Every test only reads the template or creates presentations from
+        it, so parsing the real file once is enough.
+        """
         path = Path("/Users/user/Documents/py2ppt/AWStempate.pptx")
         if path.exists():
             return Template(path)
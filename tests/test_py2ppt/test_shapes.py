@@ -1,26 +1,18 @@
 """Tests for shape manipulation features."""
 
-from pathlib import Path
+import io
 
 import pytest
 from pptx import Presentation as PptxPresentation
+from pptx.enum.dml import MSO_FILL
 
-from py2ppt import Template, Presentation, ShapeType, ConnectorType
-
-
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
+from py2ppt import ConnectorType, Presentation, ShapeType, Template
+from py2ppt.errors import InvalidDataError, SlideNotFoundError
 
 
 @pytest.fixture
 def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
+    """Create a presentation with one blank slide to draw on."""
     pres = template.create_presentation()
     pres.add_blank_slide()
     return pres
@@ -49,7 +41,6 @@ class TestAddTextbox:
         """Test adding a basic text box."""
         name = presentation.add_textbox(1, "Hello World", 1, 1, 3, 0.5)
 
-        assert name is not None
         assert isinstance(name, str)
 
     def test_add_textbox_with_formatting(self, presentation: Presentation) -> None:
@@ -68,8 +59,6 @@ class TestAddTextbox:
 
     def test_add_textbox_invalid_slide(self, presentation: Presentation) -> None:
         """Test adding textbox to invalid slide raises error."""
-        from py2ppt.errors import SlideNotFoundError
-
         with pytest.raises(SlideNotFoundError):
             presentation.add_textbox(99, "Text", 1, 1, 1, 1)
 
@@ -77,25 +66,16 @@ class TestAddTextbox:
 class TestAddShape:
     """Tests for add_shape method."""
 
-    def test_add_rectangle(self, presentation: Presentation) -> None:
-        """Test adding a rectangle shape."""
-        name = presentation.add_shape(1, "rectangle", 1, 2, 3, 2)
+    @pytest.mark.parametrize(
+        "shape_type",
+        ["rectangle", "oval", "arrow_right", ShapeType.HEXAGON.value],
+    )
+    def test_add_shape(self, presentation: Presentation, shape_type: str) -> None:
+        """Test adding each basic shape type."""
+        name = presentation.add_shape(1, shape_type, 1, 2, 3, 2)
 
-        assert name is not None
         assert isinstance(name, str)
 
-    def test_add_oval(self, presentation: Presentation) -> None:
-        """Test adding an oval shape."""
-        name = presentation.add_shape(1, "oval", 1, 2, 2, 2)
-
-        assert name is not None
-
-    def test_add_arrow(self, presentation: Presentation) -> None:
-        """Test adding an arrow shape."""
-        name = presentation.add_shape(1, "arrow_right", 1, 2, 2, 1)
-
-        assert name is not None
-
     def test_add_shape_with_text(self, presentation: Presentation) -> None:
         """Test adding a shape with text."""
         name = presentation.add_shape(
@@ -118,12 +98,6 @@ class TestAddShape:
 
         assert name is not None
 
-    def test_add_shape_enum(self, presentation: Presentation) -> None:
-        """Test adding shape using ShapeType enum value."""
-        name = presentation.add_shape(1, ShapeType.HEXAGON.value, 1, 2, 2, 2)
-
-        assert name is not None
-
     def test_add_shape_invalid_type(self, presentation: Presentation) -> None:
         """Test adding shape with invalid type raises error."""
         with pytest.raises(ValueError):
@@ -142,77 +116,120 @@ class TestAddShape:
 class TestAddConnector:
     """Tests for add_connector method."""
 
-    def test_add_elbow_connector(self, presentation: Presentation) -> None:
-        """Test adding an elbow connector."""
-        shape1 = presentation.add_shape(1, "rectangle", 1, 2, 2, 1, text="Start")
-        shape2 = presentation.add_shape(1, "rectangle", 5, 2, 2, 1, text="End")
-
-        connector = presentation.add_connector(1, shape1, shape2, "elbow")
-
-        assert connector is not None
-
-    def test_add_straight_connector(self, presentation: Presentation) -> None:
-        """Test adding a straight connector."""
-        shape1 = presentation.add_shape(1, "oval", 1, 2, 1, 1)
-        shape2 = presentation.add_shape(1, "oval", 5, 2, 1, 1)
-
-        connector = presentation.add_connector(1, shape1, shape2, "straight")
+    @pytest.fixture
+    def endpoints(self, presentation: Presentation) -> tuple[str, str]:
+        """Add the two rectangles each connector test links."""
+        start = presentation.add_shape(1, "rectangle", 1, 2, 2, 1, text="Start")
+        end = presentation.add_shape(1, "rectangle", 5, 2, 2, 1, text="End")
+        return start, end
+
+    @pytest.mark.parametrize("connector_type", ["elbow", "straight", "curved"])
+    def test_add_connector(
+        self,
+        presentation: Presentation,
+        endpoints: tuple[str, str],
+        connector_type: str,
+    ) -> None:
+        """Test adding each connector type."""
+        connector = presentation.add_connector(1, *endpoints, connector_type)
 
         assert connector is not None
 
-    def test_add_connector_with_styling(self, presentation: Presentation) -> None:
+    def test_add_connector_with_styling(
+        self, presentation: Presentation, endpoints: tuple[str, str]
+    ) -> None:
         """Test adding a connector with styling."""
-        shape1 = presentation.add_shape(1, "rectangle", 1, 2, 2, 1)
-        shape2 = presentation.add_shape(1, "rectangle", 5, 2, 2, 1)
-
         connector = presentation.add_connector(
-            1, shape1, shape2, "elbow",
+            1, *endpoints, "elbow",
             line_color="#FF0000",
             line_width=3
         )
 
         assert connector is not None
 
-    def test_add_connector_invalid_shape(self, presentation: Presentation) -> None:
-        """Test adding connector with invalid shape raises error."""
-        from py2ppt.errors import InvalidDataError
+    def test_add_connector_same_shape(
+        self, presentation: Presentation, endpoints: tuple[str, str]
+    ) -> None:
+        """Test a connector may start and end on the same shape."""
+        connector = presentation.add_connector(1, endpoints[0], endpoints[0])
 
-        shape1 = presentation.add_shape(1, "rectangle", 1, 2, 2, 1)
+        assert connector is not None
 
+    def test_add_connector_duplicate_name_uses_last(
+        self, presentation: Presentation
+    ) -> None:
+        """Test a duplicated shape name resolves to the topmost shape."""
+        slide = presentation._pptx.slides[0]
+        first = presentation.add_shape(1, "rectangle", 1, 1, 2, 1)
+        second = presentation.add_shape(1, "rectangle", 1, 4, 2, 1)
+        end = presentation.add_shape(1, "oval", 5, 2, 2, 1)
+        shapes = {shape.name: shape for shape in slide.shapes}
+        shapes[first].name = shapes[second].name = "Duplicate"
+
+        name = presentation.add_connector(1, "Duplicate", end)
+
+        connector = next(shape for shape in slide.shapes if shape.name == name)
+        start_cxn = connector._element.nvCxnSpPr.cNvCxnSpPr.stCxn
+        assert int(start_cxn.get("id")) == shapes[second].shape_id
+
+    def test_add_connector_invalid_shape(
+        self, presentation: Presentation, endpoints: tuple[str, str]
+    ) -> None:
+        """Test adding connector with invalid shape raises error."""
         with pytest.raises(InvalidDataError):
-            presentation.add_connector(1, shape1, "NonexistentShape", "elbow")
+            presentation.add_connector(
+                1, endpoints[0], "NonexistentShape", "elbow"
+            )
 
 
 class TestStyleShape:
     """Tests for style_shape method."""
 
-    def test_style_shape_fill(self, presentation: Presentation) -> None:
-        """Test styling shape fill color."""
-        shape_name = presentation.add_shape(1, "rectangle", 1, 2, 2, 2)
-
-        presentation.style_shape(1, shape_name, fill_color="#FF0000")
+    @pytest.fixture(scope="class")
+    def shape(self, template: Template) -> tuple[Presentation, str]:
+        """Create one rectangle that every styling test restyles."""
+        pres = template.create_presentation()
+        pres.add_blank_slide()
+        return pres, pres.add_shape(1, "rectangle", 1, 2, 2, 2)
+
+    @pytest.mark.parametrize(
+        "style",
+        [
+            {"fill_color": "#FF0000"},
+            {"line_color": "#0000FF", "line_width": 3},
+        ],
+        ids=["fill", "line"],
+    )
+    def test_style_shape(self, shape: tuple[Presentation, str], style: dict) -> None:
+        """Test restyling a shape's fill or line."""
+        presentation, shape_name = shape
+
+        presentation.style_shape(1, shape_name, **style)
 
         # Should not raise
         info = presentation.get_shape(1, shape_name)
         assert info["name"] == shape_name
 
-    def test_style_shape_line(self, presentation: Presentation) -> None:
-        """Test styling shape line color and width."""
-        shape_name = presentation.add_shape(1, "rectangle", 1, 2, 2, 2)
+    def test_style_shape_duplicate_name_uses_first(
+        self, presentation: Presentation
+    ) -> None:
+        """Test a duplicated shape name resolves to the first shape."""
+        slide = presentation._pptx.slides[0]
+        first = presentation.add_shape(1, "rectangle", 1, 1, 2, 1)
+        second = presentation.add_shape(1, "rectangle", 1, 4, 2, 1)
+        shapes = {shape.name: shape for shape in slide.shapes}
+        shapes[first].name = shapes[second].name = "Duplicate"
 
-        presentation.style_shape(
-            1, shape_name,
-            line_color="#0000FF",
-            line_width=3
-        )
+        presentation.style_shape(1, "Duplicate", fill_color="#FF0000")
 
-        # Should not raise
-        info = presentation.get_shape(1, shape_name)
-        assert info["name"] == shape_name
+        assert str(shapes[first].fill.fore_color.rgb) == "FF0000"
+        assert shapes[second].fill.type != MSO_FILL.SOLID
 
-    def test_style_shape_invalid_name(self, presentation: Presentation) -> None:
+    def test_style_shape_invalid_name(
+        self, shape: tuple[Presentation, str]
+    ) -> None:
         """Test styling nonexistent shape raises error."""
-        from py2ppt.errors import InvalidDataError
+        presentation, _ = shape
 
         with pytest.raises(InvalidDataError):
             presentation.style_shape(1, "NonexistentShape", fill_color="#FF0000")
@@ -221,12 +238,16 @@ class TestStyleShape:
 class TestGetShape:
     """Tests for get_shape method."""
 
-    def test_get_shape_info(self, presentation: Presentation) -> None:
+    @pytest.fixture(scope="class")
+    def shape(self, template: Template) -> tuple[Presentation, str]:
+        """Create one labelled rectangle that every lookup test reads."""
+        pres = template.create_presentation()
+        pres.add_blank_slide()
+        return pres, pres.add_shape(1, "rectangle", 2, 3, 4, 2, text="Test Shape")
+
+    def test_get_shape_info(self, shape: tuple[Presentation, str]) -> None:
         """Test getting shape information."""
-        shape_name = presentation.add_shape(
-            1, "rectangle", 2, 3, 4, 2,
-            text="Test Shape"
-        )
+        presentation, shape_name = shape
 
         info = presentation.get_shape(1, shape_name)
 
@@ -239,9 +260,9 @@ class TestGetShape:
         assert info["top_inches"] == pytest.approx(3, rel=0.1)
         assert info["text"] == "Test Shape"
 
-    def test_get_shape_invalid_name(self, presentation: Presentation) -> None:
+    def test_get_shape_invalid_name(self, shape: tuple[Presentation, str]) -> None:
         """Test getting nonexistent shape raises error."""
-        from py2ppt.errors import InvalidDataError
+        presentation, _ = shape
 
         with pytest.raises(InvalidDataError):
             presentation.get_shape(1, "NonexistentShape")
@@ -250,24 +271,25 @@ class TestGetShape:
 class TestSaveWithShapes:
     """Tests for saving presentations with shapes."""
 
-    def test_save_with_shapes(
-        self, presentation: Presentation, tmp_path: Path
-    ) -> None:
+    def test_save_with_shapes(self, presentation: Presentation) -> None:
         """Test saving presentation with shapes."""
-        presentation.add_shape(1, "rectangle", 1, 2, 3, 2, fill_color="#4472C4")
-        presentation.add_shape(1, "oval", 5, 2, 2, 2, fill_color="#ED7D31")
+        start = presentation.add_shape(
+            1, "rectangle", 1, 2, 3, 2, fill_color="#4472C4"
+        )
+        end = presentation.add_shape(1, "oval", 5, 2, 2, 2, fill_color="#ED7D31")
         presentation.add_textbox(1, "Hello World", 1, 5, 6, 1, font_size=24)
+        connector = presentation.add_connector(1, start, end)
 
-        output_path = tmp_path / "shapes_output.pptx"
-        presentation.save(output_path)
-
-        assert output_path.exists()
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
 
         # Verify saved file can be opened
-        loaded = PptxPresentation(str(output_path))
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) == 1
 
         # Check shapes exist
         slide = loaded.slides[0]
         # Should have at least the shapes we added (may have more from template)
-        assert len(slide.shapes) >= 3
+        assert len(slide.shapes) >= 4
+        assert connector in {shape.name for shape in slide.shapes}
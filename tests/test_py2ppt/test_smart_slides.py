@@ -7,12 +7,12 @@ from pathlib import Path
 TEMPLATE_PATH = Path(__file__).parent.parent.parent / "AWStempate.pptx"
 SKIP_TEMPLATE = not TEMPLATE_PATH.exists()
 
+pytestmark = pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def template():
-    """Load the real template if available."""
-    if SKIP_TEMPLATE:
-        pytest.skip("Template not available")
+    """Load the real template once; it is read-only input for every test."""
     from py2ppt import Template
     return Template(TEMPLATE_PATH)
 
@@ -26,13 +26,11 @@ def pres(template):
 class TestThemeProperty:
     """Tests for the theme property."""
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_theme_returns_helper(self, pres):
         """Test that theme property returns ThemeHelper."""
         from py2ppt.theme import ThemeHelper
         assert isinstance(pres.theme, ThemeHelper)
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_theme_has_colors(self, pres):
         """Test that theme has color properties."""
         theme = pres.theme
@@ -40,7 +38,6 @@ class TestThemeProperty:
         assert theme.dark1.startswith("#")
         assert theme.light1.startswith("#")
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_theme_colored_helper(self, pres):
         """Test theme.colored() helper."""
         result = pres.theme.colored("Test", "accent1")
@@ -51,14 +48,12 @@ class TestThemeProperty:
 class TestAddSmartSlide:
     """Tests for add_smart_slide method."""
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_smart_slide_basic(self, pres):
         """Test basic smart slide creation."""
         slide_num = pres.add_smart_slide("Test Title", ["Point 1", "Point 2"])
         assert slide_num == 1
         assert pres.slide_count == 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_smart_slide_with_statistics(self, pres):
         """Test smart slide detects statistics."""
         slide_num = pres.add_smart_slide(
@@ -67,7 +62,6 @@ class TestAddSmartSlide:
         )
         assert slide_num >= 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_smart_slide_with_comparison(self, pres):
         """Test smart slide detects comparison."""
         slide_num = pres.add_smart_slide(
@@ -80,7 +74,6 @@ class TestAddSmartSlide:
 class TestAddQuoteSlide:
     """Tests for add_quote_slide method."""
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_quote_slide_basic(self, pres):
         """Test basic quote slide."""
         slide_num = pres.add_quote_slide(
@@ -90,7 +83,6 @@ class TestAddQuoteSlide:
         assert slide_num == 1
         assert pres.slide_count == 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_quote_slide_with_source(self, pres):
         """Test quote slide with source."""
         slide_num = pres.add_quote_slide(
@@ -100,7 +92,6 @@ class TestAddQuoteSlide:
         )
         assert slide_num >= 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_quote_slide_no_attribution(self, pres):
         """Test quote slide without attribution."""
         slide_num = pres.add_quote_slide("Anonymous wisdom here.")
@@ -110,7 +101,6 @@ class TestAddQuoteSlide:
 class TestAddStatsSlide:
     """Tests for add_stats_slide method."""
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_stats_slide_basic(self, pres):
         """Test basic stats slide."""
         slide_num = pres.add_stats_slide("Key Metrics", [
@@ -120,7 +110,6 @@ class TestAddStatsSlide:
         assert slide_num == 1
         assert pres.slide_count == 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_stats_slide_many_stats(self, pres):
         """Test stats slide with many statistics."""
         slide_num = pres.add_stats_slide("By the Numbers", [
@@ -131,7 +120,6 @@ class TestAddStatsSlide:
         ])
         assert slide_num >= 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_stats_slide_value_only(self, pres):
         """Test stats with value only (no label)."""
         slide_num = pres.add_stats_slide("Numbers", [
@@ -144,7 +132,6 @@ class TestAddStatsSlide:
 class TestAddTimelineSlide:
     """Tests for add_timeline_slide method."""
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_timeline_slide_with_dicts(self, pres):
         """Test timeline slide with dict events."""
         slide_num = pres.add_timeline_slide("Our Journey", [
@@ -155,7 +142,6 @@ class TestAddTimelineSlide:
         assert slide_num == 1
         assert pres.slide_count == 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_timeline_slide_with_strings(self, pres):
         """Test timeline slide with string events."""
         slide_num = pres.add_timeline_slide("History", [
@@ -165,7 +151,6 @@ class TestAddTimelineSlide:
         ])
         assert slide_num >= 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_timeline_slide_mixed(self, pres):
         """Test timeline slide with mixed event types."""
         slide_num = pres.add_timeline_slide("Milestones", [
@@ -179,7 +164,6 @@ class TestAddTimelineSlide:
 class TestAddAgendaSlide:
     """Tests for add_agenda_slide method."""
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_agenda_slide_basic(self, pres):
         """Test basic agenda slide."""
         slide_num = pres.add_agenda_slide("Today's Agenda", [
@@ -191,7 +175,6 @@ class TestAddAgendaSlide:
         assert slide_num == 1
         assert pres.slide_count == 1
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_agenda_slide_short(self, pres):
         """Test agenda slide with few items."""
         slide_num = pres.add_agenda_slide("Topics", [
@@ -204,7 +187,6 @@ class TestAddAgendaSlide:
 class TestValidateMethod:
     """Tests for the validate method."""
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_validate_empty_presentation(self, pres):
         """Test validation of empty presentation."""
         result = pres.validate()
@@ -212,7 +194,6 @@ class TestValidateMethod:
         assert result.score < 100  # Has errors
         assert any(i.rule == "no_slides" for i in result.errors)
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_validate_good_presentation(self, pres):
         """Test validation of a well-structured presentation."""
         pres.add_title_slide("Title", "Subtitle")
@@ -224,7 +205,6 @@ class TestValidateMethod:
         assert result.is_valid is True
         assert result.score > 50
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_validate_returns_result(self, pres):
         """Test validate returns ValidationResult."""
         from py2ppt.validation import ValidationResult
@@ -232,7 +212,6 @@ class TestValidateMethod:
         result = pres.validate()
         assert isinstance(result, ValidationResult)
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_validate_strict_mode(self, pres):
         """Test validation in strict mode."""
         pres.add_content_slide("", ["Content without title"])
@@ -243,7 +222,6 @@ class TestValidateMethod:
         # Strict mode should fail on warnings
         assert result_strict.is_valid is False
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_validate_detects_issues(self, pres):
         """Test validation detects common issues."""
         # Add slides with issues
@@ -254,47 +232,49 @@ class TestValidateMethod:
         assert len(result.issues) > 0
 
 
+@pytest.fixture(scope="module")
+def q4_review(template):
+    """Build the Q4 review deck once; integration tests only read it."""
+    pres = template.create_presentation()
+    pres.add_title_slide("Q4 Review", "January 2025")
+    pres.add_agenda_slide("Agenda", [
+        "Overview",
+        "Results",
+        "Next Steps",
+    ])
+    pres.add_section_slide("Overview")
+    pres.add_content_slide("Context", [
+        "Market conditions improved",
+        "Team expanded by 20%",
+    ])
+    pres.set_notes(pres.slide_count, "Discuss market trends")
+
+    pres.add_section_slide("Results")
+    pres.add_stats_slide("Key Metrics", [
+        {"value": "150%", "label": "Revenue vs Target"},
+        {"value": "4.8", "label": "Customer Satisfaction"},
+    ])
+    pres.set_notes(pres.slide_count, "Emphasize the growth")
+
+    pres.add_section_slide("Next Steps")
+    pres.add_timeline_slide("Roadmap", [
+        {"date": "Q1", "event": "Launch new product"},
+        {"date": "Q2", "event": "Expand to Europe"},
+    ])
+
+    pres.add_title_slide("Thank You", "Questions?")
+    return pres
+
+
 class TestIntegration:
     """Integration tests for smart slides with validation."""
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
-    def test_smart_presentation_validates_well(self, pres):
+    def test_smart_presentation_validates_well(self, q4_review):
         """Test that a presentation built with smart slides validates well."""
-        # Build a good presentation
-        pres.add_title_slide("Q4 Review", "January 2025")
-        pres.add_agenda_slide("Agenda", [
-            "Overview",
-            "Results",
-            "Next Steps",
-        ])
-        pres.add_section_slide("Overview")
-        pres.add_content_slide("Context", [
-            "Market conditions improved",
-            "Team expanded by 20%",
-        ])
-        pres.set_notes(pres.slide_count, "Discuss market trends")
-
-        pres.add_section_slide("Results")
-        pres.add_stats_slide("Key Metrics", [
-            {"value": "150%", "label": "Revenue vs Target"},
-            {"value": "4.8", "label": "Customer Satisfaction"},
-        ])
-        pres.set_notes(pres.slide_count, "Emphasize the growth")
-
-        pres.add_section_slide("Next Steps")
-        pres.add_timeline_slide("Roadmap", [
-            {"date": "Q1", "event": "Launch new product"},
-            {"date": "Q2", "event": "Expand to Europe"},
-        ])
-
-        pres.add_title_slide("Thank You", "Questions?")
-
-        # Validate
-        result = pres.validate()
+        result = q4_review.validate()
         assert result.is_valid is True
         assert result.score >= 70
 
-    @pytest.mark.skipif(SKIP_TEMPLATE, reason="Template not available")
     def test_theme_colors_in_smart_slides(self, pres):
         """Test that smart slides use theme colors properly."""
         # Add slides that should use theme colors
@@ -1,27 +1,16 @@
 """Tests for table slide functionality."""
 
-from pathlib import Path
+import io
 
 import pytest
 from pptx import Presentation as PptxPresentation
 
-from py2ppt import Template, Presentation, InvalidDataError
+from py2ppt import Presentation, InvalidDataError
 
 
-@pytest.fixture
-def template(tmp_path: Path) -> Template:
-    """Create a template for testing."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return Template(template_path)
-
-
-@pytest.fixture
-def presentation(template: Template) -> Presentation:
-    """Create a presentation from template."""
-    return template.create_presentation()
+def _first_table(slide):
+    """Return the first table on a slide."""
+    return next(shape.table for shape in slide.shapes if shape.has_table)
 
 
 class TestTableSlide:
@@ -46,15 +35,7 @@ class TestTableSlide:
         rows = [["Alpha", "10"], ["Beta", "20"]]
         presentation.add_table_slide("Test", headers, rows)
 
-        slide = presentation._pptx.slides[0]
-        table_shape = None
-        for shape in slide.shapes:
-            if shape.has_table:
-                table_shape = shape
-                break
-
-        assert table_shape is not None
-        table = table_shape.table
+        table = _first_table(presentation._pptx.slides[0])
         assert len(table.rows) == 3  # 1 header + 2 data rows
         assert len(table.columns) == 2
         assert table.cell(0, 0).text == "Name"
@@ -71,11 +52,9 @@ class TestTableSlide:
             ["Item", "Count"],
             [["Widgets", 42], ["Gadgets", 99]],
         )
-        slide = presentation._pptx.slides[0]
-        for shape in slide.shapes:
-            if shape.has_table:
-                assert shape.table.cell(1, 1).text == "42"
-                assert shape.table.cell(2, 1).text == "99"
+        table = _first_table(presentation._pptx.slides[0])
+        assert table.cell(1, 1).text == "42"
+        assert table.cell(2, 1).text == "99"
 
     def test_table_empty_rows(self, presentation: Presentation) -> None:
         """Test table with no data rows."""
@@ -99,33 +78,14 @@ class TestTableSlide:
         )
         assert slide_num == 1
 
-    def test_table_theme_style(self, presentation: Presentation) -> None:
-        """Test table with theme styling."""
-        slide_num = presentation.add_table_slide(
-            "Themed",
-            ["Col1", "Col2"],
-            [["a", "b"]],
-            style="theme",
-        )
-        assert slide_num == 1
-
-    def test_table_plain_style(self, presentation: Presentation) -> None:
-        """Test table with plain styling."""
-        slide_num = presentation.add_table_slide(
-            "Plain",
-            ["Col1", "Col2"],
-            [["a", "b"]],
-            style="plain",
-        )
-        assert slide_num == 1
-
-    def test_table_striped_style(self, presentation: Presentation) -> None:
-        """Test table with striped styling."""
+    @pytest.mark.parametrize("style", ["theme", "plain", "striped"])
+    def test_table_style(self, presentation: Presentation, style: str) -> None:
+        """Test each table styling option."""
         slide_num = presentation.add_table_slide(
-            "Striped",
+            style.title(),
             ["Col1", "Col2"],
             [["a", "b"], ["c", "d"], ["e", "f"]],
-            style="striped",
+            style=style,
         )
         assert slide_num == 1
 
@@ -140,6 +100,8 @@ class TestTableSlide:
         assert "TABLE_ROW_MISMATCH" in exc_info.value.code
         d = exc_info.value.to_dict()
         assert "suggestion" in d
+        # Rows are validated before any slide is added
+        assert presentation.slide_count == 0
 
     def test_table_via_add_slide(self, presentation: Presentation) -> None:
         """Test creating a table via the add_slide auto-router."""
@@ -151,23 +113,17 @@ class TestTableSlide:
         )
         assert slide_num == 1
 
-    def test_table_save_and_reload(
-        self, presentation: Presentation, tmp_path: Path
-    ) -> None:
+    def test_table_save_and_reload(self, presentation: Presentation) -> None:
         """Test that table slides survive save/reload."""
         presentation.add_table_slide(
             "Persist",
             ["A", "B"],
             [["1", "2"]],
         )
-        output = tmp_path / "table_output.pptx"
-        presentation.save(output)
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        buffer.seek(0)
 
-        loaded = PptxPresentation(str(output))
+        loaded = PptxPresentation(buffer)
         assert len(loaded.slides) == 1
-        # Verify table exists
-        found_table = False
-        for shape in loaded.slides[0].shapes:
-            if shape.has_table:
-                found_table = True
-        assert found_table
+        assert any(shape.has_table for shape in loaded.slides[0].shapes)
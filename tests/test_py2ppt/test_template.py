@@ -1,42 +1,34 @@
 """Tests for Template class."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
 from pptx import Presentation as PptxPresentation
 
-from py2ppt import Template
+from py2ppt import Presentation, Template
 
 
-@pytest.fixture
-def blank_template(tmp_path: Path) -> Path:
-    """Create a blank presentation to use as template."""
-    template_path = tmp_path / "template.pptx"
-    pres = PptxPresentation()
-    pres.slides.add_slide(pres.slide_layouts[0])
-    pres.save(str(template_path))
-    return template_path
+@pytest.fixture(scope="module")
+def layouts(template: Template) -> list[dict]:
+    """Describe the template's layouts once per module."""
+    return template.describe()
 
 
 class TestTemplate:
     """Tests for the Template class."""
 
-    def test_load_template(self, blank_template: Path) -> None:
+    def test_load_template(self, template_path: Path) -> None:
         """Test loading a template."""
-        template = Template(blank_template)
-        assert template.path == blank_template
+        template = Template(template_path)
+        assert template.path == template_path
 
     def test_template_not_found(self, tmp_path: Path) -> None:
         """Test error when template doesn't exist."""
         with pytest.raises(FileNotFoundError):
             Template(tmp_path / "nonexistent.pptx")
 
-    def test_describe_returns_list(self, blank_template: Path) -> None:
+    def test_describe_returns_list(self, layouts: list[dict]) -> None:
         """Test that describe() returns a list of layout descriptions."""
-        template = Template(blank_template)
-        layouts = template.describe()
-
         assert isinstance(layouts, list)
         assert len(layouts) > 0
 
@@ -49,9 +41,8 @@ class TestTemplate:
         assert "placeholders" in first
         assert "best_for" in first
 
-    def test_get_colors(self, blank_template: Path) -> None:
+    def test_get_colors(self, template: Template) -> None:
         """Test getting theme colors."""
-        template = Template(blank_template)
         colors = template.colors
 
         assert isinstance(colors, dict)
@@ -61,54 +52,58 @@ class TestTemplate:
                 assert isinstance(name, str)
                 assert value.startswith("#")
 
-    def test_get_fonts(self, blank_template: Path) -> None:
+    def test_get_fonts(self, template: Template) -> None:
         """Test getting theme fonts."""
-        template = Template(blank_template)
         fonts = template.fonts
 
         assert isinstance(fonts, dict)
         assert "heading" in fonts
         assert "body" in fonts
 
-    def test_describe_as_text(self, blank_template: Path) -> None:
+    def test_describe_as_text(self, template: Template) -> None:
         """Test getting text description."""
-        template = Template(blank_template)
         text = template.describe_as_text()
 
         assert isinstance(text, str)
         assert "Template:" in text
         assert "Layouts:" in text
 
-    def test_get_layout_by_index(self, blank_template: Path) -> None:
+    def test_get_layout_by_index(self, template: Template) -> None:
         """Test getting layout by index."""
-        template = Template(blank_template)
         layout = template.get_layout(0)
 
         assert layout is not None
         assert layout.index == 0
 
-    def test_get_layout_by_name(self, blank_template: Path) -> None:
+    def test_get_layout_by_name(
+        self, template: Template, layouts: list[dict]
+    ) -> None:
         """Test getting layout by name."""
-        template = Template(blank_template)
-        layouts = template.describe()
-
         if layouts:
             name = layouts[0]["name"]
             layout = template.get_layout(name)
             assert layout is not None
 
-    def test_get_layout_names(self, blank_template: Path) -> None:
+    def test_get_layout_by_name_is_case_insensitive(
+        self, template: Template
+    ) -> None:
+        """Test a layout name resolves the same regardless of case."""
+        layout = template.get_layout("Title Slide")
+
+        assert layout is not None
+        assert template.get_layout("title slide") is layout
+        assert template.get_layout("No Such Layout") is None
+
+    def test_get_layout_names(self, template: Template) -> None:
         """Test getting all layout names."""
-        template = Template(blank_template)
         names = template.get_layout_names()
 
         assert isinstance(names, list)
         assert len(names) > 0
         assert all(isinstance(n, str) for n in names)
 
-    def test_recommend_layout(self, blank_template: Path) -> None:
+    def test_recommend_layout(self, template: Template) -> None:
         """Test layout recommendations."""
-        template = Template(blank_template)
         recs = template.recommend_layout("bullets")
 
         assert isinstance(recs, list)
@@ -120,18 +115,27 @@ class TestTemplate:
             assert "reason" in rec
             assert 0 <= rec["confidence"] <= 1
 
-    def test_create_presentation(self, blank_template: Path) -> None:
+    def test_create_presentation(self, template: Template) -> None:
         """Test creating a presentation from template."""
-        template = Template(blank_template)
         pres = template.create_presentation()
 
-        from py2ppt import Presentation
         assert isinstance(pres, Presentation)
         assert pres.slide_count == 0  # Template slides are removed
 
-    def test_repr(self, blank_template: Path) -> None:
+    def test_create_presentation_from_cached_bytes(self, tmp_path: Path) -> None:
+        """Test that presentations don't re-read the template file."""
+        path = tmp_path / "template.pptx"
+        PptxPresentation().save(str(path))
+        template = Template(path)
+        path.unlink()
+
+        pres = template.create_presentation()
+
+        assert pres.slide_count == 0
+        assert pres.add_blank_slide() == 1
+
+    def test_repr(self, template: Template) -> None:
         """Test string representation."""
-        template = Template(blank_template)
         repr_str = repr(template)
 
         assert "Template" in repr_str
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock
 from py2ppt.theme import ThemeHelper
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_template():
     """Create a mock template with theme colors and fonts."""
     template = MagicMock()
@@ -30,7 +30,7 @@ def mock_template():
     return template
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def theme(mock_template):
     """Create a ThemeHelper instance."""
     return ThemeHelper(mock_template)
@@ -39,49 +39,25 @@ def theme(mock_template):
 class TestColorProperties:
     """Tests for theme color properties."""
 
-    def test_accent1(self, theme):
-        """Test accent1 color."""
-        assert theme.accent1 == "#41B3FF"
-
-    def test_accent2(self, theme):
-        """Test accent2 color."""
-        assert theme.accent2 == "#FF6B6B"
-
-    def test_accent3(self, theme):
-        """Test accent3 color."""
-        assert theme.accent3 == "#4ECDC4"
-
-    def test_accent4(self, theme):
-        """Test accent4 color."""
-        assert theme.accent4 == "#45B7D1"
-
-    def test_accent5(self, theme):
-        """Test accent5 color."""
-        assert theme.accent5 == "#96CEB4"
-
-    def test_accent6(self, theme):
-        """Test accent6 color."""
-        assert theme.accent6 == "#FFEAA7"
-
-    def test_dark1(self, theme):
-        """Test dark1 color."""
-        assert theme.dark1 == "#2D3436"
-
-    def test_dark2(self, theme):
-        """Test dark2 color."""
-        assert theme.dark2 == "#636E72"
-
-    def test_light1(self, theme):
-        """Test light1 color."""
-        assert theme.light1 == "#FFFFFF"
-
-    def test_light2(self, theme):
-        """Test light2 color."""
-        assert theme.light2 == "#DFE6E9"
-
-    def test_hyperlink(self, theme):
-        """Test hyperlink color."""
-        assert theme.hyperlink == "#0984E3"
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("accent1", "#41B3FF"),
+            ("accent2", "#FF6B6B"),
+            ("accent3", "#4ECDC4"),
+            ("accent4", "#45B7D1"),
+            ("accent5", "#96CEB4"),
+            ("accent6", "#FFEAA7"),
+            ("dark1", "#2D3436"),
+            ("dark2", "#636E72"),
+            ("light1", "#FFFFFF"),
+            ("light2", "#DFE6E9"),
+            ("hyperlink", "#0984E3"),
+        ],
+    )
+    def test_color(self, theme, attr, expected):
+        """Test each named color property."""
+        assert getattr(theme, attr) == expected
 
     def test_accent_by_number(self, theme):
         """Test accent(n) method."""
@@ -102,13 +78,16 @@ class TestColorProperties:
 class TestFontProperties:
     """Tests for theme font properties."""
 
-    def test_heading_font(self, theme):
-        """Test heading font."""
-        assert theme.heading_font == "Arial Black"
-
-    def test_body_font(self, theme):
-        """Test body font."""
-        assert theme.body_font == "Arial"
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("heading_font", "Arial Black"),
+            ("body_font", "Arial"),
+        ],
+    )
+    def test_font(self, theme, attr, expected):
+        """Test each named font property."""
+        assert getattr(theme, attr) == expected
 
     def test_all_fonts(self, theme):
         """Test all_fonts property."""
@@ -144,11 +123,20 @@ class TestFormattingHelpers:
         assert result["color"] == "#FF6B6B"
         assert result["bold"] is True
 
-    def test_bold(self, theme):
-        """Test bold() method."""
-        result = theme.bold("Key point")
-        assert result["text"] == "Key point"
-        assert result["bold"] is True
+    @pytest.mark.parametrize(
+        "method,args,key,expected",
+        [
+            ("bold", ("Key point",), "bold", True),
+            ("italic", ("Emphasized",), "italic", True),
+            ("underline", ("Underscored",), "underline", True),
+            ("sized", ("Big text", 36), "font_size", 36),
+        ],
+    )
+    def test_simple_formatter(self, theme, method, args, key, expected):
+        """Test single-attribute formatters."""
+        result = getattr(theme, method)(*args)
+        assert result["text"] == args[0]
+        assert result[key] == expected
 
     def test_bold_with_extra_kwargs(self, theme):
         """Test bold() with additional kwargs."""
@@ -156,18 +144,6 @@ class TestFormattingHelpers:
         assert result["bold"] is True
         assert result["font_size"] == 24
 
-    def test_italic(self, theme):
-        """Test italic() method."""
-        result = theme.italic("Emphasized")
-        assert result["text"] == "Emphasized"
-        assert result["italic"] is True
-
-    def test_underline(self, theme):
-        """Test underline() method."""
-        result = theme.underline("Underscored")
-        assert result["text"] == "Underscored"
-        assert result["underline"] is True
-
     def test_bold_colored(self, theme):
         """Test bold_colored() method."""
         result = theme.bold_colored("Highlight", "accent2")
@@ -189,12 +165,6 @@ class TestFormattingHelpers:
         assert result["bold"] is True
         assert result["font_family"] == "Arial Black"
 
-    def test_sized(self, theme):
-        """Test sized() method."""
-        result = theme.sized("Big text", 36)
-        assert result["text"] == "Big text"
-        assert result["font_size"] == 36
-
     def test_sized_with_extra_kwargs(self, theme):
         """Test sized() with additional kwargs."""
         result = theme.sized("Big bold", 36, bold=True)
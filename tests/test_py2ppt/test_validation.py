@@ -1,7 +1,10 @@
 """Tests for presentation validation module."""
 
+import copy
+from collections import defaultdict
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock
 
 from py2ppt.validation import (
     IssueSeverity,
@@ -15,6 +18,27 @@ from py2ppt.validation import (
     MAX_CHARS_PER_BULLET,
 )
 
+_LONG_BULLET = "x" * (MAX_CHARS_PER_BULLET + 10)
+_WORDY_BULLET = " ".join(["word"] * (MAX_WORDS_PER_BULLET + 5))
+_TEXT_HEAVY_CONTENT = [" ".join(["word"] * 30)] * 4  # ~120 words
+
+_MIXED_ISSUES = [
+    ValidationIssue(IssueSeverity.ERROR, IssueCategory.STRUCTURE, 1, "E1", "S1"),
+    ValidationIssue(IssueSeverity.WARNING, IssueCategory.CONTENT, 2, "W1", "S2"),
+    ValidationIssue(IssueSeverity.ERROR, IssueCategory.CONTENT, 3, "E2", "S3"),
+    ValidationIssue(IssueSeverity.INFO, IssueCategory.CONTENT, 4, "I1", "S4"),
+    ValidationIssue(IssueSeverity.INFO, IssueCategory.STRUCTURE, 5, "I2", "S5"),
+    ValidationIssue(IssueSeverity.INFO, IssueCategory.DESIGN, 6, "I3", "S6"),
+]
+
+
+def _by_rule(issues):
+    """Group issues by rule name in a single pass."""
+    buckets = defaultdict(list)
+    for issue in issues:
+        buckets[issue.rule].append(issue)
+    return buckets
+
 
 class TestValidationIssue:
     """Tests for ValidationIssue dataclass."""
@@ -76,38 +100,20 @@ class TestValidationResult:
         assert len(result.issues) == 0
         assert result.score == 100.0
 
-    def test_errors_property(self):
-        """Test errors property filters correctly."""
-        issues = [
-            ValidationIssue(IssueSeverity.ERROR, IssueCategory.STRUCTURE, 1, "E1", "S1"),
-            ValidationIssue(IssueSeverity.WARNING, IssueCategory.CONTENT, 2, "W1", "S2"),
-            ValidationIssue(IssueSeverity.ERROR, IssueCategory.CONTENT, 3, "E2", "S3"),
-        ]
-        result = ValidationResult(is_valid=False, issues=issues, score=50.0)
-        assert len(result.errors) == 2
-        assert all(e.severity == IssueSeverity.ERROR for e in result.errors)
-
-    def test_warnings_property(self):
-        """Test warnings property filters correctly."""
-        issues = [
-            ValidationIssue(IssueSeverity.ERROR, IssueCategory.STRUCTURE, 1, "E1", "S1"),
-            ValidationIssue(IssueSeverity.WARNING, IssueCategory.CONTENT, 2, "W1", "S2"),
-            ValidationIssue(IssueSeverity.WARNING, IssueCategory.DESIGN, 3, "W2", "S3"),
-        ]
-        result = ValidationResult(is_valid=False, issues=issues, score=66.0)
-        assert len(result.warnings) == 2
-        assert all(w.severity == IssueSeverity.WARNING for w in result.warnings)
-
-    def test_info_property(self):
-        """Test info property filters correctly."""
-        issues = [
-            ValidationIssue(IssueSeverity.INFO, IssueCategory.CONTENT, 1, "I1", "S1"),
-            ValidationIssue(IssueSeverity.WARNING, IssueCategory.CONTENT, 2, "W1", "S2"),
-            ValidationIssue(IssueSeverity.INFO, IssueCategory.STRUCTURE, 3, "I2", "S3"),
-        ]
-        result = ValidationResult(is_valid=True, issues=issues, score=88.0)
-        assert len(result.info) == 2
-        assert all(i.severity == IssueSeverity.INFO for i in result.info)
+    @pytest.mark.parametrize(
+        "severity_attr,severity,expected",
+        [
+            ("errors", IssueSeverity.ERROR, 2),
+            ("warnings", IssueSeverity.WARNING, 1),
+            ("info", IssueSeverity.INFO, 3),
+        ],
+    )
+    def test_severity_property(self, severity_attr, severity, expected):
+        """Test severity properties filter correctly."""
+        result = ValidationResult(is_valid=False, issues=_MIXED_ISSUES, score=50.0)
+        filtered = getattr(result, severity_attr)
+        assert len(filtered) == expected
+        assert all(i.severity == severity for i in filtered)
 
     def test_by_slide(self):
         """Test by_slide method."""
@@ -178,7 +184,7 @@ class TestValidateSlide:
             "notes": "",
         }
         issues = validate_slide(slide_info)
-        title_issues = [i for i in issues if i.rule == "missing_title"]
+        title_issues = _by_rule(issues)["missing_title"]
         assert len(title_issues) == 1
         assert title_issues[0].severity == IssueSeverity.WARNING
 
@@ -192,7 +198,7 @@ class TestValidateSlide:
             "notes": "",
         }
         issues = validate_slide(slide_info, strict=True)
-        title_issues = [i for i in issues if i.rule == "missing_title"]
+        title_issues = _by_rule(issues)["missing_title"]
         assert len(title_issues) == 1
         assert title_issues[0].severity == IssueSeverity.ERROR
 
@@ -206,35 +212,33 @@ class TestValidateSlide:
             "notes": "",
         }
         issues = validate_slide(slide_info)
-        bullet_issues = [i for i in issues if i.rule == "too_many_bullets"]
+        bullet_issues = _by_rule(issues)["too_many_bullets"]
         assert len(bullet_issues) == 1
 
     def test_long_bullet_chars(self):
         """Test warning for bullet exceeding character limit."""
-        long_bullet = "x" * (MAX_CHARS_PER_BULLET + 10)
         slide_info = {
             "slide_number": 1,
             "title": "Title",
-            "content": [long_bullet],
+            "content": [_LONG_BULLET],
             "layout": "content",
             "notes": "",
         }
         issues = validate_slide(slide_info)
-        long_issues = [i for i in issues if i.rule == "bullet_too_long"]
+        long_issues = _by_rule(issues)["bullet_too_long"]
         assert len(long_issues) == 1
 
     def test_wordy_bullet(self):
         """Test info for bullet exceeding word limit."""
-        wordy_bullet = " ".join(["word"] * (MAX_WORDS_PER_BULLET + 5))
         slide_info = {
             "slide_number": 1,
             "title": "Title",
-            "content": [wordy_bullet],
+            "content": [_WORDY_BULLET],
             "layout": "content",
             "notes": "",
         }
         issues = validate_slide(slide_info)
-        wordy_issues = [i for i in issues if i.rule == "bullet_wordy"]
+        wordy_issues = _by_rule(issues)["bullet_wordy"]
         assert len(wordy_issues) == 1
         assert wordy_issues[0].severity == IssueSeverity.INFO
 
@@ -248,50 +252,21 @@ class TestValidateSlide:
             "notes": "",
         }
         issues = validate_slide(slide_info)
-        notes_issues = [i for i in issues if i.rule == "missing_notes"]
+        notes_issues = _by_rule(issues)["missing_notes"]
         assert len(notes_issues) == 1
         assert notes_issues[0].severity == IssueSeverity.INFO
 
-    def test_no_notes_warning_for_title_slide(self):
-        """Test no notes warning for title slides."""
-        slide_info = {
-            "slide_number": 1,
-            "title": "Presentation Title",
-            "content": [],
-            "layout": "title slide",
-            "notes": "",
-        }
-        issues = validate_slide(slide_info)
-        notes_issues = [i for i in issues if i.rule == "missing_notes"]
-        assert len(notes_issues) == 0
-
-    def test_no_notes_warning_for_blank_slide(self):
-        """Test no notes warning for blank slides."""
-        slide_info = {
-            "slide_number": 3,
-            "title": "",
-            "content": [],
-            "layout": "blank",
-            "notes": "",
-        }
-        issues = validate_slide(slide_info)
-        # Blank slides shouldn't trigger notes or title warnings
-        notes_issues = [i for i in issues if i.rule == "missing_notes"]
-        title_issues = [i for i in issues if i.rule == "missing_title"]
-        assert len(notes_issues) == 0
-        assert len(title_issues) == 0
-
     def test_too_much_text(self):
         """Test warning for too much text on slide."""
         slide_info = {
             "slide_number": 1,
             "title": "Title",
-            "content": [" ".join(["word"] * 30) for _ in range(4)],  # ~120 words
+            "content": _TEXT_HEAVY_CONTENT,
             "layout": "content",
             "notes": "",
         }
         issues = validate_slide(slide_info)
-        text_issues = [i for i in issues if i.rule == "too_much_text"]
+        text_issues = _by_rule(issues)["too_much_text"]
         assert len(text_issues) == 1
 
     def test_empty_content_slide(self):
@@ -306,34 +281,67 @@ class TestValidateSlide:
             "has_chart": False,
         }
         issues = validate_slide(slide_info)
-        empty_issues = [i for i in issues if i.rule == "empty_content"]
+        empty_issues = _by_rule(issues)["empty_content"]
         assert len(empty_issues) == 1
 
-    def test_no_empty_content_for_table_slides(self):
-        """Test no empty content warning for slides with tables."""
-        slide_info = {
-            "slide_number": 2,
-            "title": "Data Table",
-            "content": [],
-            "layout": "content",
-            "notes": "",
-            "has_table": True,
-            "has_chart": False,
-        }
-        issues = validate_slide(slide_info)
-        empty_issues = [i for i in issues if i.rule == "empty_content"]
-        assert len(empty_issues) == 0
+    @pytest.mark.parametrize(
+        "slide_info,rules",
+        [
+            pytest.param(
+                {
+                    "slide_number": 1,
+                    "title": "Presentation Title",
+                    "content": [],
+                    "layout": "title slide",
+                    "notes": "",
+                },
+                ["missing_notes"],
+                id="title_slide_no_notes",
+            ),
+            pytest.param(
+                {
+                    "slide_number": 3,
+                    "title": "",
+                    "content": [],
+                    "layout": "blank",
+                    "notes": "",
+                },
+                ["missing_notes", "missing_title"],
+                id="blank_slide_no_notes_or_title",
+            ),
+            pytest.param(
+                {
+                    "slide_number": 2,
+                    "title": "Data Table",
+                    "content": [],
+                    "layout": "content",
+                    "notes": "",
+                    "has_table": True,
+                    "has_chart": False,
+                },
+                ["empty_content"],
+                id="table_slide_not_empty",
+            ),
+        ],
+    )
+    def test_rule_not_triggered(self, slide_info, rules):
+        """Test slides that are exempt from specific rules."""
+        by_rule = _by_rule(validate_slide(slide_info))
+        for rule in rules:
+            assert len(by_rule[rule]) == 0
 
 
 class TestValidatePresentation:
     """Tests for validate_presentation function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_presentation(self):
-        """Create a mock presentation."""
-        pres = MagicMock()
-        pres.slide_count = 5
-        pres.describe_all_slides.return_value = [
+        """Create a stub presentation shared by the read-only tests.
+
+        Tests that need different slides must patch ``describe_all_slides``
+        via ``monkeypatch`` to return a deep copy.
+        """
+        slides = [
             {
                 "slide_number": 1,
                 "layout": "title slide",
@@ -380,7 +388,7 @@ class TestValidatePresentation:
                 "has_chart": False,
             },
         ]
-        return pres
+        return SimpleNamespace(slide_count=5, describe_all_slides=lambda: slides)
 
     def test_valid_presentation(self, mock_presentation):
         """Test validation of a valid presentation."""
@@ -390,9 +398,7 @@ class TestValidatePresentation:
 
     def test_no_slides_error(self):
         """Test error for presentation with no slides."""
-        pres = MagicMock()
-        pres.slide_count = 0
-        pres.describe_all_slides.return_value = []
+        pres = SimpleNamespace(slide_count=0, describe_all_slides=lambda: [])
 
         result = validate_presentation(pres)
         assert result.is_valid is False
@@ -401,9 +407,7 @@ class TestValidatePresentation:
 
     def test_few_slides_warning(self):
         """Test warning for presentation with only one slide."""
-        pres = MagicMock()
-        pres.slide_count = 1
-        pres.describe_all_slides.return_value = [
+        slides = [
             {
                 "slide_number": 1,
                 "layout": "title slide",
@@ -412,40 +416,40 @@ class TestValidatePresentation:
                 "notes": "",
             }
         ]
+        pres = SimpleNamespace(slide_count=1, describe_all_slides=lambda: slides)
 
         result = validate_presentation(pres)
-        warnings = [i for i in result.warnings if i.rule == "few_slides"]
+        warnings = _by_rule(result.warnings)["few_slides"]
         assert len(warnings) == 1
 
-    def test_missing_title_slide_warning(self, mock_presentation):
+    def test_missing_title_slide_warning(self, mock_presentation, monkeypatch):
         """Test warning for missing title slide."""
         # Change first slide to not be a title slide
-        mock_presentation.describe_all_slides.return_value[0]["layout"] = "content"
+        slides = copy.deepcopy(mock_presentation.describe_all_slides())
+        slides[0]["layout"] = "content"
+        monkeypatch.setattr(mock_presentation, "describe_all_slides", lambda: slides)
 
         result = validate_presentation(mock_presentation)
-        title_slide_issues = [i for i in result.issues if i.rule == "missing_title_slide"]
+        title_slide_issues = _by_rule(result.issues)["missing_title_slide"]
         assert len(title_slide_issues) == 1
 
     def test_missing_closing_info(self):
         """Test info for missing closing slide."""
-        pres = MagicMock()
-        pres.slide_count = 5
-        pres.describe_all_slides.return_value = [
+        slides = [
             {"slide_number": i, "layout": "content" if i > 1 else "title slide",
              "title": f"Slide {i}", "content": [], "notes": ""}
             for i in range(1, 6)
         ]
-        pres.describe_all_slides.return_value[0]["layout"] = "title slide"
+        slides[0]["layout"] = "title slide"
+        pres = SimpleNamespace(slide_count=5, describe_all_slides=lambda: slides)
 
         result = validate_presentation(pres)
-        closing_issues = [i for i in result.issues if i.rule == "missing_closing"]
+        closing_issues = _by_rule(result.issues)["missing_closing"]
         assert len(closing_issues) == 1
 
     def test_needs_section_break(self):
         """Test info for too many slides without section break."""
-        pres = MagicMock()
-        pres.slide_count = 8
-        pres.describe_all_slides.return_value = [
+        slides = [
             {
                 "slide_number": i,
                 "layout": "title slide" if i == 1 else "content",
@@ -455,17 +459,16 @@ class TestValidatePresentation:
             }
             for i in range(1, 9)
         ]
+        pres = SimpleNamespace(slide_count=8, describe_all_slides=lambda: slides)
 
         result = validate_presentation(pres)
-        section_issues = [i for i in result.issues if i.rule == "needs_section_break"]
+        section_issues = _by_rule(result.issues)["needs_section_break"]
         # Should trigger after more than 5 content slides
         assert len(section_issues) >= 1
 
     def test_repetitive_layout(self):
         """Test info for repetitive layouts."""
-        pres = MagicMock()
-        pres.slide_count = 6
-        pres.describe_all_slides.return_value = [
+        slides = [
             {
                 "slide_number": i,
                 "layout": "content",  # All same layout
@@ -475,16 +478,15 @@ class TestValidatePresentation:
             }
             for i in range(1, 7)
         ]
+        pres = SimpleNamespace(slide_count=6, describe_all_slides=lambda: slides)
 
         result = validate_presentation(pres)
-        layout_issues = [i for i in result.issues if i.rule == "repetitive_layout"]
+        layout_issues = _by_rule(result.issues)["repetitive_layout"]
         assert len(layout_issues) >= 1
 
     def test_low_layout_variety(self):
         """Test info for low layout variety."""
-        pres = MagicMock()
-        pres.slide_count = 6
-        pres.describe_all_slides.return_value = [
+        slides = [
             {
                 "slide_number": i,
                 "layout": "content",
@@ -494,15 +496,18 @@ class TestValidatePresentation:
             }
             for i in range(1, 7)
         ]
+        pres = SimpleNamespace(slide_count=6, describe_all_slides=lambda: slides)
 
         result = validate_presentation(pres)
-        variety_issues = [i for i in result.issues if i.rule == "low_layout_variety"]
+        variety_issues = _by_rule(result.issues)["low_layout_variety"]
         assert len(variety_issues) == 1
 
-    def test_strict_mode(self, mock_presentation):
+    def test_strict_mode(self, mock_presentation, monkeypatch):
         """Test strict mode treats warnings as failures."""
         # Add a slide without title
-        mock_presentation.describe_all_slides.return_value[3]["title"] = ""
+        slides = copy.deepcopy(mock_presentation.describe_all_slides())
+        slides[3]["title"] = ""
+        monkeypatch.setattr(mock_presentation, "describe_all_slides", lambda: slides)
 
         result_normal = validate_presentation(mock_presentation, strict=False)
         result_strict = validate_presentation(mock_presentation, strict=True)
@@ -521,10 +526,8 @@ class TestValidatePresentation:
 
     def test_score_decreases_with_issues(self):
         """Test score decreases with issues."""
-        pres = MagicMock()
-        pres.slide_count = 3
         # Create slides with problems
-        pres.describe_all_slides.return_value = [
+        slides = [
             {
                 "slide_number": 1,
                 "layout": "content",  # Not a title slide
@@ -547,6 +550,7 @@ class TestValidatePresentation:
                 "notes": "",
             },
         ]
+        pres = SimpleNamespace(slide_count=3, describe_all_slides=lambda: slides)
 
         result = validate_presentation(pres)
         # Score should be significantly reduced
@@ -556,15 +560,18 @@ class TestValidatePresentation:
 class TestEnums:
     """Tests for enum values."""
 
-    def test_issue_severity_values(self):
-        """Test IssueSeverity enum values."""
-        assert IssueSeverity.ERROR.value == "error"
-        assert IssueSeverity.WARNING.value == "warning"
-        assert IssueSeverity.INFO.value == "info"
-
-    def test_issue_category_values(self):
-        """Test IssueCategory enum values."""
-        assert IssueCategory.CONTENT.value == "content"
-        assert IssueCategory.STRUCTURE.value == "structure"
-        assert IssueCategory.DESIGN.value == "design"
-        assert IssueCategory.ACCESSIBILITY.value == "accessibility"
+    @pytest.mark.parametrize(
+        "member, expected",
+        [
+            (IssueSeverity.ERROR, "error"),
+            (IssueSeverity.WARNING, "warning"),
+            (IssueSeverity.INFO, "info"),
+            (IssueCategory.CONTENT, "content"),
+            (IssueCategory.STRUCTURE, "structure"),
+            (IssueCategory.DESIGN, "design"),
+            (IssueCategory.ACCESSIBILITY, "accessibility"),
+        ],
+    )
+    def test_enum_value(self, member, expected):
+        """Test IssueSeverity and IssueCategory enum values."""
+        assert member.value == expected